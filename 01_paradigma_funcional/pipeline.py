@@ -0,0 +1,138 @@
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from functools import reduce
+from typing import Any, Generic, NamedTuple, Optional, TypeVar
+import csv
+import math
+
+T = TypeVar('T')
+U = TypeVar('U')
+A = TypeVar('A')
+
+# Lectura perezosa: cada generador consume al anterior y nunca se carga el archivo completo
+def leer_lineas(ruta: str) -> Iterator[str]:
+    with open(ruta, newline='') as archivo:
+        yield from archivo
+
+def separar_campos(lineas: Iterable[str]) -> Iterator[list[str]]:
+    # csv.reader respeta los campos entre comillas con comas (por ejemplo, los nombres de titanic.csv)
+    yield from csv.reader(lineas)
+
+def a_diccionarios(filas: Iterable[list[str]]) -> Iterator[dict[str, str]]:
+    filas = iter(filas)
+    encabezado = next(filas, [])
+    for fila in filas:
+        yield dict(zip(encabezado, fila))
+
+def leer_csv(ruta: str) -> Iterator[dict[str, str]]:
+    return a_diccionarios(separar_campos(leer_lineas(ruta)))
+
+def columna(registros: Iterable[dict[str, str]], nombre: str) -> Iterator[float]:
+    # Se descartan los valores faltantes
+    return (float(registro[nombre]) for registro in registros if registro[nombre] != '')
+
+
+# Algoritmo de Welford: media y varianza en una sola pasada, como un reduce sobre un acumulado inmutable
+class Estadisticas(NamedTuple):
+    cantidad: int = 0
+    media: float = 0.0
+    m2: float = 0.0
+
+    @property
+    def varianza(self) -> float:
+        return self.m2 / self.cantidad if self.cantidad else math.nan
+
+    @property
+    def desvio(self) -> float:
+        return math.sqrt(self.varianza)
+
+def agregar(acumulado: Estadisticas, valor: float) -> Estadisticas:
+    cantidad = acumulado.cantidad + 1
+    delta = valor - acumulado.media
+    media = acumulado.media + delta / cantidad
+    return Estadisticas(cantidad, media, acumulado.m2 + delta * (valor - media))
+
+def quitar(acumulado: Estadisticas, valor: float) -> Estadisticas:
+    cantidad = acumulado.cantidad - 1
+    if cantidad == 0:
+        return Estadisticas()
+    delta = valor - acumulado.media
+    media = acumulado.media - delta / cantidad
+    return Estadisticas(cantidad, media, acumulado.m2 - delta * (valor - media))
+
+def estadisticas(valores: Iterable[float]) -> Estadisticas:
+    return reduce(agregar, valores, Estadisticas())
+
+
+def zscore(media: float, desvio: float, valor: float) -> float:
+    return (valor - media) / desvio
+
+def es_outlier(z_score: float, limite: float = 3) -> bool:
+    return z_score > limite or z_score < (limite * -1)
+
+def outliers(valores: Iterable[float], ventana: int = 100, limite: float = 3) -> Iterator[float]:
+    # Cada valor se compara contra la media y el desvio de los ultimos `ventana` valores previos,
+    # asi que la memoria usada es O(ventana) y no O(n). Recien se evalua con la ventana completa.
+    buffer: deque[float] = deque()
+    acumulado = Estadisticas()
+    for valor in valores:
+        if acumulado.cantidad == ventana and acumulado.desvio > 0 and es_outlier(zscore(acumulado.media, acumulado.desvio, valor), limite):
+            yield valor
+        buffer.append(valor)
+        acumulado = agregar(acumulado, valor)
+        if len(buffer) > ventana:
+            acumulado = quitar(acumulado, buffer.popleft())
+
+
+class Pipeline(Generic[T]):
+    # Las etapas se acumulan sin ejecutarse y al consumir el pipeline se aplican todas juntas,
+    # elemento por elemento, en un unico ciclo y sin listas intermedias
+    _DESCARTAR: Any = object()
+
+    def __init__(self, fuente: Iterable[Any], etapas: Optional[list[Callable[[Any], Any]]] = None):
+        self._fuente = fuente
+        self._etapas: list[Callable[[Any], Any]] = etapas or []
+
+    def _con_etapa(self, etapa: Callable[[Any], Any]) -> "Pipeline[Any]":
+        return Pipeline(self._fuente, self._etapas + [etapa])
+
+    def mapear(self, f: Callable[[T], U]) -> "Pipeline[U]":
+        return self._con_etapa(f)
+
+    def filtrar(self, predicado: Callable[[T], bool]) -> "Pipeline[T]":
+        descartar = Pipeline._DESCARTAR
+        return self._con_etapa(lambda x: x if predicado(x) else descartar)
+
+    def __iter__(self) -> Iterator[T]:
+        descartar = Pipeline._DESCARTAR
+        etapas = self._etapas
+        for elemento in self._fuente:
+            for etapa in etapas:
+                elemento = etapa(elemento)
+                if elemento is descartar:
+                    break
+            else:
+                yield elemento
+
+    def reducir(self, f: Callable[[A, T], A], inicial: A) -> A:
+        return reduce(f, self, inicial)
+
+
+if __name__ == '__main__':
+    import os
+
+    datasets = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'datasets')
+    iris = os.path.join(datasets, 'IRIS.csv')
+
+    setosa = (
+        Pipeline(leer_csv(iris))
+        .filtrar(lambda registro: registro['species'] == 'Iris-setosa')
+        .mapear(lambda registro: float(registro['sepal_width']))
+    )
+    print(f'Suma sepal_width setosa: {setosa.reducir(lambda x, y: x + y, 0.0):.1f}')     # 170.9
+    resumen = Pipeline(leer_csv(iris)).filtrar(lambda registro: registro['species'] == 'Iris-setosa') \
+        .mapear(lambda registro: float(registro['sepal_width'])).reducir(agregar, Estadisticas())
+    print(f'Promedio sepal_width setosa: {resumen.media:.3f}, desvio: {resumen.desvio:.3f}')   # 3.418
+
+    tarifas = columna(leer_csv(os.path.join(datasets, 'titanic.csv')), 'Fare')
+    print(f'Tarifas outliers en titanic.csv: {list(outliers(tarifas, ventana=50))}')
@@ -0,0 +1,74 @@
+from collections.abc import Iterator
+from itertools import compress, count, islice, takewhile
+from typing import Optional
+import math
+import numpy as np
+
+# Tamaño de cada segmento de la criba: entra en la cache L1/L2 del procesador
+SEGMENTO = 2 ** 15
+
+
+def primos_hasta(n: int) -> np.ndarray:
+    # Criba de Eratostenes sobre los impares en un arreglo de NumPy: criba[i] representa a 2i + 1
+    if n < 2:
+        return np.array([], dtype=np.int64)
+    criba = np.ones((n + 1) // 2, dtype=bool)
+    criba[0] = False
+    for i in range(1, (math.isqrt(n) - 1) // 2 + 1):
+        if criba[i]:
+            p = 2 * i + 1
+            criba[p * p // 2::p] = False
+    return np.concatenate(([2], 2 * np.nonzero(criba)[0] + 1)).astype(np.int64)
+
+
+def generador_primos(n: Optional[int] = None) -> Iterator[int]:
+    # Criba segmentada incremental: produce los primos de a un segmento por vez, sin limite si n es None
+    yield from takewhile(lambda p: n is None or p <= n, _criba_segmentada())
+
+
+def _criba_segmentada() -> Iterator[int]:
+    base: list[int] = []      # primos hasta la raiz del final del segmento actual
+    limite_base = 1
+    for bajo in count(0, SEGMENTO):
+        alto = bajo + SEGMENTO
+        raiz = math.isqrt(alto - 1)
+        if raiz > limite_base:
+            limite_base = max(raiz, 2 * limite_base)
+            base = primos_hasta(limite_base).tolist()
+
+        segmento = bytearray([1]) * SEGMENTO
+        for p in takewhile(lambda p: p <= raiz, base):
+            inicio = max(p * p, -(-bajo // p) * p) - bajo
+            segmento[inicio::p] = bytes(len(range(inicio, SEGMENTO, p)))
+        if bajo == 0:
+            segmento[0] = segmento[1] = 0
+        yield from compress(range(bajo, alto), segmento)
+
+
+def generador_primos_division(n: Optional[int] = None) -> Iterator[int]:
+    # Version por division de prueba, como referencia para comparar
+    for candidato in count(2):
+        if n is not None and candidato > n:
+            return
+        if all(candidato % d for d in range(2, math.isqrt(candidato) + 1)):
+            yield candidato
+
+
+if __name__ == '__main__':
+    import time
+
+    print(list(generador_primos(100)))
+
+    cantidad = 10 ** 5
+    for nombre, generador in [('division de prueba', generador_primos_division), ('criba segmentada', generador_primos)]:
+        inicio = time.perf_counter()
+        ultimo = list(islice(generador(), cantidad))[-1]
+        print(f'{nombre:>20}: primeros {cantidad} primos (el ultimo es {ultimo}) en {time.perf_counter() - inicio:.2f}s')
+
+    inicio = time.perf_counter()
+    ultimo = list(islice(generador_primos(), 10 ** 6))[-1]
+    print(f'{"criba segmentada":>20}: primeros {10 ** 6} primos (el ultimo es {ultimo}) en {time.perf_counter() - inicio:.2f}s')
+
+    inicio = time.perf_counter()
+    primos = primos_hasta(10 ** 7)
+    print(f'{"primos_hasta":>20}: {len(primos)} primos hasta 10^7 en {time.perf_counter() - inicio:.2f}s')
@@ -0,0 +1,285 @@
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Hashable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Generic, Optional, TypeVar
+import math
+import os
+
+E = TypeVar('E')
+
+# Fin de los candidatos de un nivel (None puede ser un estado valido)
+_AGOTADO = object()
+
+class Problema(ABC, Generic[E]):
+    # Un estado E es una solucion parcial
+    @abstractmethod
+    def inicial(self) -> E:
+        ...
+
+    @abstractmethod
+    def candidatos(self, estado: E) -> Iterable[E]:
+        ...
+
+    @abstractmethod
+    def es_solucion(self, estado: E) -> bool:
+        ...
+
+    def es_valido(self, estado: E) -> bool:
+        return True
+
+    def clave(self, estado: E) -> Optional[Hashable]:
+        # Estados con la misma clave son equivalentes y solo se exploran una vez (None: sin memoizacion)
+        # En mejor_solucion solo se explora la de menor costo, asi que el costo de extender un estado
+        # no debe depender de como se llego a el
+        return None
+
+    def costo(self, estado: E) -> float:
+        return 0
+
+    def cota(self, estado: E) -> float:
+        # Costo minimo de cualquier solucion que extienda al estado, para podar en mejor_solucion
+        return -math.inf
+
+    def serializar(self, estado: E) -> Any:
+        # Forma en que un estado viaja entre procesos en buscar_en_paralelo; conviene redefinirla
+        # si el estado es una cadena enlazada, que pickle recorre recursivamente
+        return estado
+
+    def deserializar(self, datos: Any) -> E:
+        return datos
+
+
+def buscar(problema: Problema[E], desde: Optional[E] = None) -> Iterator[E]:
+    return _buscar(problema, problema.inicial() if desde is None else desde, set())
+
+
+def _buscar(problema: Problema[E], desde: E, visitados: set[Hashable]) -> Iterator[E]:
+    # Backtracking con pila explicita de iteradores: cada nivel guarda los candidatos que le quedan por probar,
+    # por eso no depende de la pila de ejecucion y las soluciones se producen a demanda
+    pila: list[Iterator[E]] = [iter([desde])]
+    while pila:
+        estado = next(pila[-1], _AGOTADO)
+        if estado is _AGOTADO:
+            pila.pop()
+            continue
+        if not problema.es_valido(estado):
+            continue
+        clave = problema.clave(estado)
+        if clave is not None:
+            if clave in visitados:
+                continue
+            visitados.add(clave)
+        if problema.es_solucion(estado):
+            yield estado
+        else:
+            pila.append(iter(problema.candidatos(estado)))
+
+
+def mejor_solucion(problema: Problema[E]) -> Optional[E]:
+    # Igual que buscar, pero descartando las ramas cuya cota no mejora la mejor solucion encontrada
+    # y los estados equivalentes (misma clave) a uno ya alcanzado con costo menor o igual
+    mejor: Optional[E] = None
+    mejor_costo = math.inf
+    costos: dict[Hashable, float] = {}
+    pila: list[Iterator[E]] = [iter([problema.inicial()])]
+    while pila:
+        estado = next(pila[-1], _AGOTADO)
+        if estado is _AGOTADO:
+            pila.pop()
+        elif problema.es_valido(estado) and problema.cota(estado) < mejor_costo:
+            clave = problema.clave(estado)
+            if clave is not None:
+                costo = problema.costo(estado)
+                if costos.get(clave, math.inf) <= costo:
+                    continue
+                costos[clave] = costo
+            if problema.es_solucion(estado):
+                mejor, mejor_costo = estado, problema.costo(estado)
+            else:
+                pila.append(iter(problema.candidatos(estado)))
+    return mejor
+
+
+def _buscar_rama(problema: Problema[E], desde: Any, vistos: frozenset[Hashable]) -> list[Any]:
+    # Las claves ya vistas al armar la frontera no se vuelven a explorar, salvo la del estado de partida
+    estado = problema.deserializar(desde)
+    visitados = set(vistos)
+    visitados.discard(problema.clave(estado))
+    return [problema.serializar(solucion) for solucion in _buscar(problema, estado, visitados)]
+
+
+def buscar_en_paralelo(problema: Problema[E], workers: Optional[int] = None, ramas_por_worker: int = 4) -> Iterator[E]:
+    # Se expanden los primeros niveles hasta tener varias ramas por worker y cada rama se explora en otro
+    # proceso; el problema debe poder serializarse. Hay a lo sumo `workers` ramas en curso y sus soluciones
+    # se producen en orden: si se deja de consumir, las ramas pendientes no se exploran.
+    # Las claves alcanzadas al armar la frontera valen para todas las ramas; las que alcanza cada rama
+    # despues son independientes, asi que puede haber mas soluciones que con buscar.
+    workers = workers or os.cpu_count() or 1
+    visitados: set[Hashable] = set()
+    frontera: deque[E] = deque([problema.inicial()])
+    ramas: list[E] = []
+    while frontera and len(frontera) < workers * ramas_por_worker:
+        estado = frontera.popleft()
+        if not problema.es_valido(estado):
+            continue
+        clave = problema.clave(estado)
+        if clave is not None:
+            if clave in visitados:
+                continue
+            visitados.add(clave)
+        if problema.es_solucion(estado):
+            yield estado
+        else:
+            frontera.extend(problema.candidatos(estado))
+    for estado in frontera:
+        clave = problema.clave(estado)
+        if clave is not None:
+            if clave in visitados:
+                continue
+            visitados.add(clave)
+        ramas.append(estado)
+    if not ramas:
+        return
+    vistos = frozenset(visitados)
+    with ProcessPoolExecutor(max_workers=workers) as ejecutor:
+        en_curso: deque[Future[list[Any]]] = deque()
+        try:
+            for estado in ramas:
+                en_curso.append(ejecutor.submit(_buscar_rama, problema, problema.serializar(estado), vistos))
+                if len(en_curso) == workers:
+                    yield from map(problema.deserializar, en_curso.popleft().result())
+            while en_curso:
+                yield from map(problema.deserializar, en_curso.popleft().result())
+        finally:
+            for rama in en_curso:
+                rama.cancel()
+
+
+Posicion = tuple[int, int]
+# (posicion, largo del camino, celdas visitadas como mascara de bits, estado previo): extender un camino
+# es O(1) en nodos. La mascara solo hace falta con todos=True; si alcanza con un camino, la clave ya evita
+# volver a una celda y el estado no guarda una mascara por celda del camino (None).
+EstadoLaberinto = tuple[Posicion, int, Optional[int], Optional["EstadoLaberinto"]]
+
+class Laberinto(Problema[EstadoLaberinto]):
+    # Cada fila es un entero donde el bit j en 1 indica un muro en la columna j
+    def __init__(self, filas: list[int], ancho: int, todos: bool = False):
+        self.filas = filas
+        self.ancho = ancho
+        self.alto = len(filas)
+        self.entrada: Posicion = (0, 0)
+        self.salida: Posicion = (self.alto - 1, ancho - 1)
+        self.todos = todos
+
+    @staticmethod
+    def desde_texto(lineas: list[str], todos: bool = False) -> "Laberinto":
+        # '#' es muro, cualquier otro caracter es paso
+        filas = [sum(1 << j for j, celda in enumerate(linea) if celda == '#') for linea in lineas]
+        return Laberinto(filas, len(lineas[0]), todos)
+
+    def hay_paso(self, posicion: Posicion) -> bool:
+        i, j = posicion
+        return 0 <= i < self.alto and 0 <= j < self.ancho and not (self.filas[i] >> j) & 1
+
+    def _bit(self, posicion: Posicion) -> int:
+        return 1 << (posicion[0] * self.ancho + posicion[1])
+
+    def inicial(self) -> EstadoLaberinto:
+        return (self.entrada, 1, self._bit(self.entrada) if self.todos else None, None)
+
+    def candidatos(self, estado: EstadoLaberinto) -> Iterable[EstadoLaberinto]:
+        (i, j), largo, visitados, _ = estado
+        # Orden de busqueda: este, oeste, sur, norte
+        for posicion in ((i, j + 1), (i, j - 1), (i + 1, j), (i - 1, j)):
+            if not self.hay_paso(posicion):
+                continue
+            if visitados is None:
+                yield (posicion, largo + 1, None, estado)
+            elif not visitados & self._bit(posicion):
+                yield (posicion, largo + 1, visitados | self._bit(posicion), estado)
+
+    def es_solucion(self, estado: EstadoLaberinto) -> bool:
+        return estado[0] == self.salida
+
+    def clave(self, estado: EstadoLaberinto) -> Optional[Hashable]:
+        # Si alcanza con un camino, llegar dos veces a la misma celda es equivalente
+        return None if self.todos else estado[0]
+
+    def costo(self, estado: EstadoLaberinto) -> float:
+        return estado[1]
+
+    def cota(self, estado: EstadoLaberinto) -> float:
+        (i, j), _, _, _ = estado
+        return self.costo(estado) + abs(self.salida[0] - i) + abs(self.salida[1] - j)
+
+    def serializar(self, estado: EstadoLaberinto) -> list[Posicion]:
+        return Laberinto.camino(estado)
+
+    def deserializar(self, camino: list[Posicion]) -> EstadoLaberinto:
+        # Rearma la cadena de estados (y las mascaras, si hacen falta) a partir del camino
+        estado: Optional[EstadoLaberinto] = None
+        visitados = 0
+        for largo, posicion in enumerate(camino, 1):
+            visitados |= self._bit(posicion)
+            estado = (posicion, largo, visitados if self.todos else None, estado)
+        assert estado is not None
+        return estado
+
+    @staticmethod
+    def camino(estado: EstadoLaberinto) -> list[Posicion]:
+        camino: list[Posicion] = []
+        actual: Optional[EstadoLaberinto] = estado
+        while actual is not None:
+            camino.append(actual[0])
+            actual = actual[3]
+        return camino[::-1]
+
+
+# (prefijo, mascara de posiciones ya usadas)
+EstadoPermutacion = tuple[tuple[int, ...], int]
+
+class Permutaciones(Problema[EstadoPermutacion]):
+    def __init__(self, elementos: list[int]):
+        self.elementos = elementos
+
+    def inicial(self) -> EstadoPermutacion:
+        return ((), 0)
+
+    def candidatos(self, estado: EstadoPermutacion) -> Iterable[EstadoPermutacion]:
+        prefijo, usados = estado
+        for i, elemento in enumerate(self.elementos):
+            if not (usados >> i) & 1:
+                yield (prefijo + (elemento,), usados | (1 << i))
+
+    def es_solucion(self, estado: EstadoPermutacion) -> bool:
+        return len(estado[0]) == len(self.elementos)
+
+
+def permutaciones(xs: list[int]) -> Iterator[list[int]]:
+    return (list(prefijo) for prefijo, _ in buscar(Permutaciones(xs)))
+
+
+if __name__ == '__main__':
+    print(list(permutaciones([6, 2, 3])))   # [[6, 2, 3], [6, 3, 2], [2, 6, 3], [2, 3, 6], [3, 6, 2], [3, 2, 6]]
+
+    laberinto = Laberinto.desde_texto([
+        '..#....',
+        '#.#.##.',
+        '#...#..',
+        '###.#.#',
+        '......#',
+        '.####..',
+    ])
+    primera = next(buscar(laberinto))
+    print(f'Primer camino: {Laberinto.camino(primera)}')
+    mejor = mejor_solucion(laberinto)
+    assert mejor is not None
+    print(f'Camino mas corto ({len(Laberinto.camino(mejor))} pasos): {Laberinto.camino(mejor)}')
+    laberinto.todos = True
+    print(f'Cantidad de caminos: {sum(1 for _ in buscar(laberinto))}')
+    print(f'Cantidad de caminos (en paralelo): {sum(1 for _ in buscar_en_paralelo(laberinto))}')
+
+    # Un laberinto grande sin muros: la version recursiva superaria el limite de recursion
+    grande = Laberinto([0] * 300, 300)
+    print(f'Largo del camino en 300x300: {len(Laberinto.camino(next(buscar(grande))))}')
@@ -1,5 +1,5 @@
-from typing import Generic, TypeVar, Optional, TypeAlias
-from copy import copy
+from typing import Any, Generic, TypeVar, Optional, TypeAlias
+from copy import copy, deepcopy
 
 T = TypeVar('T')
 ListaGenerica: TypeAlias = "Lista[T]"
@@ -16,6 +16,39 @@ class Lista(Generic[T]):
     def __init__(self):
         self._head: Optional[Nodo[T]] = None
 
+    def __copy__(self) -> ListaGenerica:
+        # Copia superficial: comparte los nodos (es la que usa insertar)
+        nueva = Lista()
+        nueva._head = self._head
+        return nueva
+
+    def _codificar(self) -> list[T]:
+        datos: list[T] = []
+        actual = self._head
+        while actual is not None:
+            datos.append(actual.dato)
+            actual = actual.sig._head
+        return datos
+
+    @staticmethod
+    def _decodificar(datos: list[T]) -> ListaGenerica:
+        # Se arma desde el final con un ciclo, sin recursion
+        actual = Lista()
+        for dato in reversed(datos):
+            nueva = Lista()
+            nueva._head = Nodo(dato, actual)
+            actual = nueva
+        return actual
+
+    def __reduce__(self):
+        # pickle y deepcopy recorren la lista como una lista de Python y no nodo por nodo recursivamente
+        return (Lista._decodificar, (self._codificar(),))
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> ListaGenerica:
+        nueva = Lista._decodificar(deepcopy(self._codificar(), memo))
+        memo[id(self)] = nueva
+        return nueva
+
     def es_vacia(self) -> bool:
         return self._head is None
 
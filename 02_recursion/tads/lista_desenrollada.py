@@ -0,0 +1,261 @@
+from array import array
+from collections.abc import Iterator
+from itertools import zip_longest
+from typing import Generic, TypeVar, Optional, TypeAlias
+from copy import copy
+
+T = TypeVar('T')
+ListaDesenrolladaGenerica: TypeAlias = "ListaDesenrollada[T]"
+
+class Bloque(Generic[T]):
+    # Hasta `capacidad` elementos contiguos, en orden, en una lista de Python o en un array tipado
+    def __init__(self, datos: "list[T] | array", sig: "Optional[Bloque[T]]" = None):
+        self.datos = datos
+        self.sig = sig
+
+class ListaDesenrollada(Generic[T]):
+    # Misma interfaz que Lista, pero los elementos se guardan en bloques enlazados de tamaño fijo:
+    # hay un nodo cada `capacidad` elementos y los recorridos dentro de un bloque no siguen punteros.
+    # Con `tipo` (un codigo de array como 'q' o 'd') los bloques guardan numeros sin un objeto por elemento.
+    def __init__(self, capacidad: int = 64, tipo: Optional[str] = None):
+        if capacidad < 2:
+            raise ValueError('la capacidad de un bloque debe ser al menos 2')
+        self._capacidad = capacidad
+        self._tipo = tipo
+        self._head: Optional[Bloque[T]] = None
+        self._cantidad = 0
+
+    def _datos_vacios(self) -> "list[T] | array":
+        return [] if self._tipo is None else array(self._tipo)
+
+    def _bloques(self) -> Iterator[Bloque[T]]:
+        actual = self._head
+        while actual is not None:
+            yield actual
+            actual = actual.sig
+
+    def _vacia_como(self) -> ListaDesenrolladaGenerica:
+        return ListaDesenrollada(self._capacidad, self._tipo)
+
+    def es_vacia(self) -> bool:
+        return self._head is None
+
+    def head(self) -> T:
+        if self.es_vacia():
+            raise IndexError('lista vacia')
+        else:
+            return self._head.datos[0]
+
+    def copy(self) -> ListaDesenrolladaGenerica:
+        nueva = self._vacia_como()
+        anterior: Optional[Bloque[T]] = None
+        for bloque in self._bloques():
+            # Como en Lista, se copia cada dato (un array ya guarda copias de sus numeros)
+            datos = array(self._tipo, bloque.datos) if self._tipo is not None else [copy(dato) for dato in bloque.datos]
+            nuevo = Bloque(datos)
+            if anterior is None:
+                nueva._head = nuevo
+            else:
+                anterior.sig = nuevo
+            anterior = nuevo
+        nueva._cantidad = self._cantidad
+        return nueva
+
+    def tail(self) -> ListaDesenrolladaGenerica:
+        if self.es_vacia():
+            raise IndexError('lista vacia')
+        else:
+            resto = self.copy()
+            resto._eliminar_en(resto._head, None, 0)
+            return resto
+
+    def insertar(self, dato: T):
+        # Inserta al principio: en el primer bloque si tiene lugar (mover a lo sumo `capacidad` referencias)
+        if self._head is None or len(self._head.datos) == self._capacidad:
+            self._head = Bloque(self._datos_vacios(), self._head)
+        self._head.datos.insert(0, dato)
+        self._cantidad += 1
+
+    def _eliminar_en(self, bloque: Bloque[T], previo: Optional[Bloque[T]], i: int):
+        del bloque.datos[i]
+        self._cantidad -= 1
+        if not bloque.datos:
+            if previo is None:
+                self._head = bloque.sig
+            else:
+                previo.sig = bloque.sig
+        elif bloque.sig is not None and len(bloque.datos) + len(bloque.sig.datos) <= self._capacidad // 2:
+            # Se fusionan bloques poco ocupados para que no degenere en un nodo por elemento
+            bloque.datos.extend(bloque.sig.datos)
+            bloque.sig = bloque.sig.sig
+
+    def eliminar(self, valor: T):
+        previo: Optional[Bloque[T]] = None
+        for bloque in self._bloques():
+            if valor in bloque.datos:
+                self._eliminar_en(bloque, previo, bloque.datos.index(valor))
+                return
+            previo = bloque
+
+    def ultimo(self) -> T:
+        if self.es_vacia():
+            raise IndexError('lista vacia')
+        for bloque in self._bloques():
+            pass
+        return bloque.datos[-1]
+
+    def concat(self, ys: ListaDesenrolladaGenerica) -> ListaDesenrolladaGenerica:
+        resultado = self.copy()
+        copia_ys = ys.copy()
+        if resultado._head is None:
+            return copia_ys
+        for ultimo in resultado._bloques():
+            pass
+        ultimo.sig = copia_ys._head
+        resultado._cantidad += copia_ys._cantidad
+        return resultado
+
+    def join(self, separador: str = '') -> str:
+        return separador.join(map(str, self))
+
+    def index(self, valor: T) -> int:
+        desplazamiento = 0
+        for bloque in self._bloques():
+            if valor in bloque.datos:
+                return desplazamiento + bloque.datos.index(valor)
+            desplazamiento += len(bloque.datos)
+        raise ValueError(f'{valor} no esta en la lista')
+
+    def existe(self, valor: T) -> bool:
+        return any(valor in bloque.datos for bloque in self._bloques())
+
+    def __iter__(self) -> Iterator[T]:
+        for bloque in self._bloques():
+            yield from bloque.datos
+
+    def __len__(self) -> int:
+        return self._cantidad
+
+    def __getitem__(self, i: int) -> T:
+        if i < 0:
+            i += self._cantidad
+        if 0 <= i < self._cantidad:
+            for bloque in self._bloques():
+                if i < len(bloque.datos):
+                    return bloque.datos[i]
+                i -= len(bloque.datos)
+        raise IndexError('indice fuera de rango')
+
+    def __reduce__(self):
+        # Como Lista: se serializan solo los datos, sin recorrer los bloques recursivamente
+        return (ListaDesenrollada._decodificar, (self._capacidad, self._tipo, list(self)))
+
+    @staticmethod
+    def _decodificar(capacidad: int, tipo: Optional[str], datos: list[T]) -> ListaDesenrolladaGenerica:
+        nueva: ListaDesenrollada[T] = ListaDesenrollada(capacidad, tipo)
+        for dato in reversed(datos):
+            nueva.insertar(dato)
+        return nueva
+
+    def __repr__(self):
+        return f'[{", ".join(map(repr, self))}]'
+
+    def __eq__(self, otra: ListaDesenrolladaGenerica) -> bool:
+        fin = object()
+        return isinstance(otra, ListaDesenrollada) and len(self) == len(otra) and \
+            all(x == y for x, y in zip_longest(self, otra, fillvalue=fin))
+
+
+def comparar_con_lista(cantidad: int = 10 ** 5):
+    import time
+    import tracemalloc
+    from lista import Lista
+
+    def recorrer_lista(xs: Lista[int]) -> int:
+        # Lista no tiene __iter__: se siguen los nodos uno por uno
+        total = 0
+        actual = xs
+        while not actual.es_vacia():
+            total += actual._head.dato
+            actual = actual._head.sig
+        return total
+
+    def existe_en_lista(xs: Lista[int], valor: int) -> bool:
+        actual = xs
+        while not actual.es_vacia():
+            if actual._head.dato == valor:
+                return True
+            actual = actual._head.sig
+        return False
+
+    def medir(nombre: str, construir, recorrer, existe):
+        tracemalloc.start()
+        inicio = time.perf_counter()
+        xs = construir()
+        construccion = time.perf_counter() - inicio
+        memoria = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        inicio = time.perf_counter()
+        recorrer(xs)
+        recorrido = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        existe(xs, -1)
+        busqueda = time.perf_counter() - inicio
+        print(f'{nombre:>30}: {memoria / cantidad:6.1f} bytes por elemento, insertar {construccion * 1000:6.1f}ms, '
+              f'recorrer {recorrido * 1000:6.1f}ms, existe {busqueda * 1000:6.1f}ms')
+
+    def construir_lista() -> Lista[int]:
+        xs: Lista[int] = Lista()
+        for i in range(cantidad):
+            xs.insertar(i)
+        return xs
+
+    def construir_desenrollada(tipo: Optional[str]) -> ListaDesenrollada[int]:
+        xs: ListaDesenrollada[int] = ListaDesenrollada(tipo=tipo)
+        for i in range(cantidad):
+            xs.insertar(i)
+        return xs
+
+    print(f'{cantidad} enteros:')
+    medir('Lista', construir_lista, recorrer_lista, existe_en_lista)
+    medir('ListaDesenrollada', lambda: construir_desenrollada(None), sum, ListaDesenrollada.existe)
+    medir("ListaDesenrollada('q')", lambda: construir_desenrollada('q'), sum, ListaDesenrollada.existe)
+
+
+if __name__ == '__main__':
+    xs: ListaDesenrollada[int] = ListaDesenrollada(capacidad=4)
+
+    print(f'xs es vacia? {xs.es_vacia()}')	# True
+
+    # Operaciones basicas
+    xs.insertar(4)
+    xs.insertar(10)
+    xs.insertar(20)
+    ys: ListaDesenrollada[int] = xs.tail()
+    ys.insertar(9)
+    ys.eliminar(10)
+    ys.insertar(8)
+    zs: ListaDesenrollada[int] = ys.copy()
+    zs.eliminar(8)
+    zs.eliminar(9)
+
+    print(f'xs: {xs}')						# [20, 10, 4]
+    print(f'ys: {ys}')						# [8, 9, 4]
+    print(f'xs es vacia? {xs.es_vacia()}')	# False
+    print(f'ultimo(xs): {xs.ultimo()}')		# 4
+    print(f'len(xs): {len(ys)}')			# 3
+    print(f'xs[1]: {xs[1]}')				# 10
+
+    for x in xs:
+        print(x)	# 20 -> 10 -> 4
+
+    print(f'xs.concat(ys): {xs.concat(ys)}')		# [20, 10, 4, 8, 9, 4]
+    print(f'ys.join(" -> "): {ys.join(" -> ")}')	# 8 -> 9 -> 4
+    print(f'xs.index(4): {xs.index(4)}')			# 2
+    print(f'xs.existe(10): {xs.existe(10)}')        # True
+    print(f'xs == zs? {xs == zs}')                  # False
+    zs.insertar(10)
+    zs.insertar(20)
+    print(f'xs == zs? {xs == zs}')                  # True
+
+    comparar_con_lista()
@@ -1,4 +1,4 @@
-from typing import Union, TypeAlias
+from typing import Any, Union, TypeAlias
 
 __all__ = ['Nat', 'cero', 'division', 'es_cero', 'igual', 'mayor', 'mayor_igual', 'menor', 'menor_igual', 'nat_to_int', 'potencia', 'pred', 'producto', 'resta', 'suc', 'suma']
 
@@ -25,6 +25,28 @@ class Suc:
     def __str__(self):
         return str(nat_to_int(self))
 
+    def __reduce__(self):
+        # Una cadena de Suc se serializa como un entero, asi pickle y deepcopy no recorren la cadena recursivamente
+        return (_desde_int, (_contar_suc(self),))
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "Suc":
+        nuevo = _desde_int(_contar_suc(self))
+        memo[id(self)] = nuevo
+        return nuevo
+
+def _contar_suc(n: Nat) -> int:
+    cantidad = 0
+    while isinstance(n, Suc):
+        cantidad += 1
+        n = n.pred
+    return cantidad
+
+def _desde_int(cantidad: int) -> Nat:
+    n: Nat = Cero()
+    for _ in range(cantidad):
+        n = Suc(n)
+    return n
+
 # Operaciones
 def cero() -> Nat:
     return Cero()
@@ -0,0 +1,50 @@
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backtracking import Laberinto, buscar, buscar_en_paralelo
+
+
+@pytest.fixture
+def laberinto():
+    return Laberinto.desde_texto([
+        '..#....',
+        '#.#.##.',
+        '#...#..',
+        '###.#.#',
+        '......#',
+        '.####..',
+    ])
+
+
+def serpentina(alto: int, ancho: int) -> Laberinto:
+    # Filas libres unidas por un unico paso, alternando el extremo: un solo camino muy largo
+    completa = (1 << ancho) - 1
+    filas = [0 if i % 2 == 0 else completa & ~(1 << (ancho - 1) if i % 4 == 1 else 1) for i in range(alto)]
+    # Un segundo paso al comienzo, para que haya mas de una rama
+    filas[1] &= ~1
+    return Laberinto(filas, ancho)
+
+
+@pytest.mark.parametrize('workers', [1, 2, 8])
+def test_paralelo_caminos_simples(laberinto, workers):
+    caminos = [Laberinto.camino(solucion) for solucion in buscar_en_paralelo(laberinto, workers, 2)]
+    assert caminos[0] == Laberinto.camino(next(buscar(laberinto)))
+    assert all(len(set(camino)) == len(camino) for camino in caminos)
+
+def test_paralelo_todos(laberinto):
+    laberinto.todos = True
+    esperados = sorted(Laberinto.camino(solucion) for solucion in buscar(laberinto))
+    assert sorted(Laberinto.camino(solucion) for solucion in buscar_en_paralelo(laberinto, 2)) == esperados
+
+def test_paralelo_camino_largo():
+    grande = serpentina(41, 61)
+    soluciones = list(buscar_en_paralelo(grande, 2, 1))
+    assert [len(Laberinto.camino(solucion)) for solucion in soluciones] == [1301, 1181]
+    assert [solucion[1] for solucion in soluciones] == [1301, 1181]
+
+def test_serializar(laberinto):
+    laberinto.todos = True
+    solucion = next(buscar(laberinto))
+    assert laberinto.deserializar(laberinto.serializar(solucion)) == solucion
@@ -0,0 +1,261 @@
+from collections import OrderedDict
+from collections.abc import Iterator
+from bisect import bisect_left, bisect_right
+from typing import Optional
+import mmap
+import os
+import struct
+
+# Paginas de tamaño fijo en un archivo: la pagina 0 guarda los metadatos y el resto son nodos.
+# Las claves son enteros de 64 bits para poder serializarlas con un formato fijo.
+MAGICO = 0x41524231
+FORMATO_META = '<qqqqq'
+MIN_CLAVE, MAX_CLAVE = -2 ** 63, 2 ** 63 - 1
+
+
+class PaginaB:
+    def __init__(self, numero: int, es_hoja: bool, claves: list[int], hijos: list[int]):
+        self.numero = numero
+        self.es_hoja = es_hoja
+        self.claves = claves
+        self.hijos = hijos
+        self.sucia = False
+
+
+class ArbolB:
+    def __init__(self, ruta: str, grado: int = 64, paginas_en_cache: int = 256):
+        # grado t: cada nodo tiene entre t - 1 y 2t - 1 claves (salvo la raiz) y hasta 2t hijos
+        if grado < 2:
+            raise ValueError('El grado minimo de un arbol B es 2')
+        if paginas_en_cache < 3:
+            raise ValueError('La cache necesita al menos 3 paginas para poder dividir nodos')
+        self._grado = grado
+        self._max_claves = 2 * grado - 1
+        self._formato = struct.Struct(f'<qq{self._max_claves}q{2 * grado}q')
+        self._tam_pagina = self._formato.size
+        self._paginas_en_cache = paginas_en_cache
+        self._cache: OrderedDict[int, PaginaB] = OrderedDict()
+
+        existe = os.path.exists(ruta) and os.path.getsize(ruta) > 0
+        self._archivo = open(ruta, 'r+b' if existe else 'w+b')
+        if existe:
+            self._mmap = mmap.mmap(self._archivo.fileno(), 0)
+            magico, grado_archivo, self._raiz, self._paginas, self._cantidad = struct.unpack_from(FORMATO_META, self._mmap, 0)
+            if magico != MAGICO or grado_archivo != grado:
+                self._mmap.close()
+                self._archivo.close()
+                raise ValueError(f'{ruta} no es un arbol B de grado {grado}')
+        else:
+            self._archivo.truncate(self._tam_pagina * 16)
+            self._mmap = mmap.mmap(self._archivo.fileno(), 0)
+            self._paginas = 1
+            self._cantidad = 0
+            self._raiz = self._nueva_pagina(True).numero
+
+    def __enter__(self) -> "ArbolB":
+        return self
+
+    def __exit__(self, *_):
+        self.cerrar()
+
+    def _leer(self, numero: int) -> PaginaB:
+        campos = self._formato.unpack_from(self._mmap, numero * self._tam_pagina)
+        es_hoja, n = campos[0], campos[1]
+        claves = list(campos[2:2 + n])
+        hijos = [] if es_hoja else list(campos[2 + self._max_claves:2 + self._max_claves + n + 1])
+        return PaginaB(numero, bool(es_hoja), claves, hijos)
+
+    def _escribir(self, pagina: PaginaB):
+        claves = pagina.claves + [0] * (self._max_claves - len(pagina.claves))
+        hijos = pagina.hijos + [0] * (self._max_claves + 1 - len(pagina.hijos))
+        self._formato.pack_into(self._mmap, pagina.numero * self._tam_pagina, int(pagina.es_hoja), len(pagina.claves), *claves, *hijos)
+        pagina.sucia = False
+
+    def _pagina(self, numero: int) -> PaginaB:
+        pagina = self._cache.get(numero)
+        if pagina is None:
+            pagina = self._leer(numero)
+            self._cachear(pagina)
+        else:
+            self._cache.move_to_end(numero)
+        return pagina
+
+    def _cachear(self, pagina: PaginaB):
+        self._cache[pagina.numero] = pagina
+        self._cache.move_to_end(pagina.numero)
+        while len(self._cache) > self._paginas_en_cache:
+            _, desalojada = self._cache.popitem(last=False)
+            if desalojada.sucia:
+                self._escribir(desalojada)
+
+    def _marcar(self, pagina: PaginaB):
+        # Se vuelve a cachear por si fue desalojada mientras se la modificaba
+        pagina.sucia = True
+        self._cachear(pagina)
+
+    def _nueva_pagina(self, es_hoja: bool) -> PaginaB:
+        if (self._paginas + 1) * self._tam_pagina > len(self._mmap):
+            self._mmap.flush()
+            self._mmap.close()
+            self._archivo.truncate(2 * self._paginas * self._tam_pagina)
+            self._mmap = mmap.mmap(self._archivo.fileno(), 0)
+        pagina = PaginaB(self._paginas, es_hoja, [], [])
+        self._paginas += 1
+        self._marcar(pagina)
+        return pagina
+
+    def _dividir_hijo(self, padre: PaginaB, i: int):
+        t = self._grado
+        hijo = self._pagina(padre.hijos[i])
+        nuevo = self._nueva_pagina(hijo.es_hoja)
+        nuevo.claves = hijo.claves[t:]
+        if not hijo.es_hoja:
+            nuevo.hijos = hijo.hijos[t:]
+            hijo.hijos = hijo.hijos[:t]
+        padre.claves.insert(i, hijo.claves[t - 1])
+        padre.hijos.insert(i + 1, nuevo.numero)
+        hijo.claves = hijo.claves[:t - 1]
+        for pagina in (hijo, nuevo, padre):
+            self._marcar(pagina)
+
+    def insertar(self, clave: int):
+        # Se valida antes de tocar la cache: una clave invalida fallaria recien al escribir su pagina,
+        # quizas durante un desalojo o en cerrar()
+        if not isinstance(clave, int):
+            raise TypeError(f'Las claves deben ser enteros, no {type(clave).__name__}')
+        if not MIN_CLAVE <= clave <= MAX_CLAVE:
+            raise ValueError(f'La clave {clave} no entra en 64 bits')
+        raiz = self._pagina(self._raiz)
+        if len(raiz.claves) == self._max_claves:
+            nueva_raiz = self._nueva_pagina(False)
+            nueva_raiz.hijos = [raiz.numero]
+            self._raiz = nueva_raiz.numero
+            self._dividir_hijo(nueva_raiz, 0)
+        # Division preventiva (CLRS): nunca se baja a un nodo lleno, asi no hace falta volver hacia arriba
+        pagina = self._pagina(self._raiz)
+        while not pagina.es_hoja:
+            i = bisect_right(pagina.claves, clave)
+            if len(self._pagina(pagina.hijos[i]).claves) == self._max_claves:
+                self._dividir_hijo(pagina, i)
+                if clave >= pagina.claves[i]:
+                    i += 1
+            pagina = self._pagina(pagina.hijos[i])
+        pagina.claves.insert(bisect_right(pagina.claves, clave), clave)
+        self._marcar(pagina)
+        self._cantidad += 1
+
+    def pertenece(self, clave: int) -> bool:
+        pagina = self._pagina(self._raiz)
+        while True:
+            i = bisect_left(pagina.claves, clave)
+            if i < len(pagina.claves) and pagina.claves[i] == clave:
+                return True
+            if pagina.es_hoja:
+                return False
+            pagina = self._pagina(pagina.hijos[i])
+
+    def _recorrer(self, desde: Optional[int]) -> Iterator[int]:
+        # Inorder con pila explicita de (pagina, posicion); se guardan numeros y no objetos
+        # para no retener paginas que la cache pueda desalojar entre un yield y el siguiente
+        pila: list[tuple[int, int]] = []
+        numero = self._raiz
+        while True:
+            pagina = self._pagina(numero)
+            i = 0 if desde is None else bisect_left(pagina.claves, desde)
+            pila.append((numero, i))
+            if pagina.es_hoja:
+                break
+            numero = pagina.hijos[i]
+        while pila:
+            numero, i = pila.pop()
+            pagina = self._pagina(numero)
+            if i < len(pagina.claves):
+                pila.append((numero, i + 1))
+                clave = pagina.claves[i]
+                if not pagina.es_hoja:
+                    numero = pagina.hijos[i + 1]
+                    while True:
+                        pila.append((numero, 0))
+                        pagina = self._pagina(numero)
+                        if pagina.es_hoja:
+                            break
+                        numero = pagina.hijos[0]
+                yield clave
+
+    def __iter__(self) -> Iterator[int]:
+        return self._recorrer(None)
+
+    def rango(self, desde: int, hasta: int) -> Iterator[int]:
+        # Claves en [desde, hasta)
+        for clave in self._recorrer(desde):
+            if clave >= hasta:
+                return
+            yield clave
+
+    def __len__(self) -> int:
+        return self._cantidad
+
+    def altura(self) -> int:
+        altura = 1
+        pagina = self._pagina(self._raiz)
+        while not pagina.es_hoja:
+            pagina = self._pagina(pagina.hijos[0])
+            altura += 1
+        return altura
+
+    def sincronizar(self):
+        for pagina in self._cache.values():
+            if pagina.sucia:
+                self._escribir(pagina)
+        struct.pack_into(FORMATO_META, self._mmap, 0, MAGICO, self._grado, self._raiz, self._paginas, self._cantidad)
+        self._mmap.flush()
+
+    def cerrar(self):
+        if self._mmap.closed:
+            return
+        try:
+            self.sincronizar()
+        finally:
+            self._cache.clear()
+            self._mmap.close()
+            self._archivo.close()
+
+
+def main():
+    import random
+    import sys
+    import tempfile
+    import time
+    from arbol_binario_ordenado import ArbolBinarioOrdenado
+
+    # Con 10**7 claves se necesita bastante tiempo en Python puro: se puede pasar n por linea de comandos
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 5
+    claves = [random.randrange(-2 ** 62, 2 ** 62) for _ in range(n)]
+
+    with tempfile.TemporaryDirectory() as directorio:
+        inicio = time.perf_counter()
+        with ArbolB(os.path.join(directorio, 'indice.arbolb')) as arbol_b:
+            for clave in claves:
+                arbol_b.insertar(clave)
+            insercion_b = time.perf_counter() - inicio
+            inicio = time.perf_counter()
+            encontradas_b = sum(arbol_b.pertenece(clave) for clave in claves[::10])
+            busqueda_b = time.perf_counter() - inicio
+            print(f'Arbol B: altura {arbol_b.altura()}, {len(arbol_b)} claves')
+
+    sys.setrecursionlimit(10 ** 5)
+    inicio = time.perf_counter()
+    abo: ArbolBinarioOrdenado[int] = ArbolBinarioOrdenado()
+    for clave in claves:
+        abo.insertar(clave)
+    insercion_abo = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    encontradas_abo = sum(abo.pertenece(clave) for clave in claves[::10])
+    busqueda_abo = time.perf_counter() - inicio
+
+    print(f'Insercion de {n} claves: arbol B {insercion_b:.2f}s, ABO {insercion_abo:.2f}s')
+    print(f'Busqueda de {n // 10} claves: arbol B {busqueda_b:.2f}s ({encontradas_b}), ABO {busqueda_abo:.2f}s ({encontradas_abo})')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,13 @@
-from collections.abc import Callable
-from typing import Any, Generic, Optional, TypeVar
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Callable, Iterator
+from typing import Any, Generic, Optional, TextIO, TypeVar
 from functools import wraps
+from copy import copy, deepcopy
+import io
+import sys
+import threading
+import weakref
 
 T = TypeVar('T')
 
@@ -13,9 +20,100 @@ class NodoAB(Generic[T]):
     def __str__(self):
         return self.dato
     
+class IndiceAB(Generic[T]):
+    def __init__(self, raiz: "ArbolBinario[T]"):
+        self.raiz = raiz
+        self.entradas: dict[T, tuple[ArbolBinario[T], int, tuple[int, ...]]] = {}
+        self.vigente = False
+        # Cada reconstruccion es una generacion nueva: los subarboles que ya no estan en el arbol
+        # conservan una generacion vieja y no registran nada en el indice
+        self.generacion = 0
+
+    def registrar(self, subarbol: "ArbolBinario[T]", nivel: int, camino: tuple[int, ...]):
+        # BFS: ante valores repetidos queda registrada la aparicion mas cercana a la raiz.
+        # Tambien se marcan los subarboles vacios, para enterarse de un set_raiz posterior.
+        cola = deque([(subarbol, nivel, camino)])
+        while cola:
+            actual, nivel, camino = cola.popleft()
+            actual._indice = self
+            actual._ubicacion = (nivel, camino)
+            actual._generacion = self.generacion
+            if actual.raiz is not None:
+                registrado = self.entradas.get(actual.raiz.dato)
+                if registrado is None or registrado[1] > nivel:
+                    self.entradas[actual.raiz.dato] = (actual, nivel, camino)
+                cola.append((actual.si(), nivel + 1, camino + (0,)))
+                cola.append((actual.sd(), nivel + 1, camino + (1,)))
+
+    def reconstruir(self):
+        self.entradas.clear()
+        self.generacion += 1
+        self.registrar(self.raiz, 1, ())
+        self.vigente = True
+
+    def buscar(self, x: T) -> "Optional[tuple[ArbolBinario[T], int, tuple[int, ...]]]":
+        if not self.vigente:
+            self.reconstruir()
+        return self.entradas.get(x)
+
+    def memoria(self) -> int:
+        return sys.getsizeof(self.entradas) + sum(
+            sys.getsizeof(entrada) + sys.getsizeof(entrada[2]) for entrada in self.entradas.values()
+        )
+
+
+class _Version:
+    # Instante en el que se tomo una copia. Mientras alguna vista lo use, cada arbol que se modifique
+    # conserva en su historia el estado que tenia en ese instante.
+    reloj: int = 0
+    vivas: list[int] = []
+    _cerrojo = threading.RLock()
+
+    def __init__(self, numero: int):
+        self.numero = numero
+
+    @staticmethod
+    def nueva() -> "_Version":
+        with _Version._cerrojo:
+            version = _Version(_Version.reloj)
+            _Version.vivas.append(version.numero)
+            _Version.reloj += 1
+        return version
+
+    @staticmethod
+    def alguna_entre(desde: int, hasta: int) -> bool:
+        # Hay alguna version viva v con desde <= v < hasta
+        with _Version._cerrojo:
+            i = bisect_left(_Version.vivas, desde)
+            return i < len(_Version.vivas) and _Version.vivas[i] < hasta
+
+    def __del__(self):
+        with _Version._cerrojo:
+            i = bisect_left(_Version.vivas, self.numero)
+            if i < len(_Version.vivas) and _Version.vivas[i] == self.numero:
+                del _Version.vivas[i]
+
+# (instante en que se asigno, raiz, version de la vista o None, espejado)
+Estado = tuple[int, Optional[NodoAB[Any]], Optional[_Version], bool]
+
+
 class ArbolBinario(Generic[T]):
     def __init__(self):
         self.raiz: Optional[NodoAB[T]] = None
+        self._indice: Optional[IndiceAB[T]] = None
+        self._ubicacion: tuple[int, tuple[int, ...]] = (1, ())
+        self._generacion: int = 0
+        # Vistas perezosas (copy y espejo): leen los subarboles tal como estaban en _version, sin copiarlos.
+        # Los nodos no se modifican una vez enlazados: cambiar un arbol es asignarle otra raiz (ver _asignar)
+        self._version: Optional[_Version] = None
+        self._espejado: bool = False
+        self._hijos: Optional[list[Optional[weakref.ref[ArbolBinario[T]]]]] = None
+        self._estado: Estado = (_Version.reloj, None, None, False)
+        self._historia: Optional[list[Estado]] = None
+        # Arbol que contiene a este como subarbol (y de que lado), para invalidar caches o desdoblar vistas
+        self._padre: Optional[tuple[ArbolBinario[T], int]] = None
+        self._tam: Optional[int] = None
+        self._alt: Optional[int] = None
         
     class _Decoradores:
         @classmethod
@@ -30,7 +128,7 @@ class ArbolBinario(Generic[T]):
     @staticmethod
     def crear_nodo(dato: T, si: "Optional[ArbolBinario[T]]" = None, sd: "Optional[ArbolBinario[T]]" = None) -> "ArbolBinario[T]":
         t = ArbolBinario()
-        t.raiz = NodoAB(dato, si, sd)
+        t.set_raiz(NodoAB(dato, si, sd))
         return t
 
     def es_vacio(self) -> bool:
@@ -39,11 +137,15 @@ class ArbolBinario(Generic[T]):
     @_Decoradores.valida_es_vacio
     def si(self) -> "ArbolBinario[T]":
         assert self.raiz is not None
+        if self._version is not None:
+            return self._hijo(0)
         return self.raiz.si
     
     @_Decoradores.valida_es_vacio
     def sd(self) -> "ArbolBinario[T]":
         assert self.raiz is not None
+        if self._version is not None:
+            return self._hijo(1)
         return self.raiz.sd
     
     def es_hoja(self) -> bool:
@@ -56,42 +158,300 @@ class ArbolBinario(Generic[T]):
     
     @_Decoradores.valida_es_vacio
     def insertar_si(self, si: "ArbolBinario[T]"):
+        self._verificar_libre(si, 0)
+        self._desdoblar()
         assert self.raiz is not None
-        self.raiz.si = si
+        anterior = self.raiz.si
+        nodo = copy(self.raiz)
+        nodo.si = si
+        self._asignar(nodo)
+        self._enlazar(anterior, si, 0)
+        self._actualizar_indice(anterior, si, 0)
 
     @_Decoradores.valida_es_vacio
     def insertar_sd(self, sd: "ArbolBinario[T]"):
+        self._verificar_libre(sd, 1)
+        self._desdoblar()
         assert self.raiz is not None
-        self.raiz.sd = sd
+        anterior = self.raiz.sd
+        nodo = copy(self.raiz)
+        nodo.sd = sd
+        self._asignar(nodo)
+        self._enlazar(anterior, sd, 1)
+        self._actualizar_indice(anterior, sd, 1)
+
+    def set_raiz(self, nodo: Optional[NodoAB[T]]):
+        if nodo is not None:
+            self._verificar_libre(nodo.si, 0)
+            self._verificar_libre(nodo.sd, 1)
+        self._desdoblar()
+        anterior = self.raiz
+        self._asignar(nodo)
+        if nodo is not None:
+            nodo.si._padre = (self, 0)
+            nodo.sd._padre = (self, 1)
+        self._invalidar()
+        if self._en_indice() and self._indice.vigente:
+            if anterior is not None:
+                self._indice.vigente = False
+            else:
+                self._indice.registrar(self, *self._ubicacion)
+
+    def _asignar(self, raiz: Optional[NodoAB[T]], version: Optional[_Version] = None, espejado: bool = False):
+        # Si alguna vista viva puede estar leyendo el estado actual, se lo guarda en la historia
+        # (descartando los estados que ya no lee ninguna). La historia se publica antes que el estado nuevo,
+        # asi un lector concurrente siempre encuentra el estado de su version.
+        anterior = self._estado
+        reloj = _Version.reloj
+        if anterior[0] < reloj and (self._historia is not None or _Version.alguna_entre(anterior[0], reloj)):
+            estados = (self._historia or []) + [anterior]
+            hasta = [estado[0] for estado in estados[1:]] + [reloj]
+            historia = [estado for estado, fin in zip(estados, hasta) if _Version.alguna_entre(estado[0], fin)]
+            self._historia = historia or None
+        self._estado = (reloj, raiz, version, espejado)
+        self.raiz, self._version, self._espejado = raiz, version, espejado
+
+    def _estado_en(self, version: _Version) -> Estado:
+        estado = self._estado
+        if estado[0] <= version.numero:
+            return estado
+        for anterior in reversed(self._historia or []):
+            if anterior[0] <= version.numero:
+                return anterior
+        return estado
+
+    def _vista(self, raiz: Optional[NodoAB[T]], version: _Version, espejado: bool, padre: "Optional[tuple[ArbolBinario[T], int]]") -> "ArbolBinario[T]":
+        vista = type(self)()
+        vista._estado = (vista._estado[0], raiz, version, espejado)
+        vista.raiz, vista._version, vista._espejado = raiz, version, espejado
+        vista._hijos = [None, None]
+        vista._padre = padre
+        return vista
+
+    def _hijo(self, lado: int) -> "ArbolBinario[T]":
+        # Subarbol de una vista, leido en la version de la vista. Se recuerda debilmente para que, mientras
+        # alguien lo use, cada lado tenga un unico objeto (y al desdoblar quede enlazado ese mismo objeto)
+        assert self.raiz is not None and self._version is not None and self._hijos is not None
+        referencia = self._hijos[lado]
+        hijo = None if referencia is None else referencia()
+        if hijo is None:
+            fuente = (self.raiz.si, self.raiz.sd)[lado ^ self._espejado]
+            _, raiz, version, espejado = fuente._estado_en(self._version)
+            if version is None:
+                version, espejado = self._version, self._espejado
+            else:
+                espejado = espejado != self._espejado
+            hijo = self._vista(raiz, version, espejado, (self, lado))
+            self._hijos[lado] = weakref.ref(hijo)
+        return hijo
+
+    def _desdoblar(self):
+        # Copy-on-write: antes de modificar una vista se copia su nodo y el camino desde la raiz de la vista.
+        # Los hijos del nodo copiado siguen siendo vistas. Se limpian los caches de todo el camino: los
+        # subarboles de una vista se crean a demanda y sin cache, debajo de ancestros que pueden tenerlo,
+        # asi que _invalidar no llegaria a ellos
+        if self._version is None:
+            return
+        self._tam = self._alt = None
+        if self._padre is not None:
+            # Al desdoblarse, el padre enlaza en su nodo a sus hijos vivos, entre ellos a este arbol
+            self._padre[0]._desdoblar()
+        nodo = None
+        if self.raiz is not None:
+            nodo = copy(self.raiz)
+            nodo.si, nodo.sd = self._hijo(0), self._hijo(1)
+        self._hijos = None
+        self._asignar(nodo)
+
+    def materializar(self) -> "ArbolBinario[T]":
+        nuevo = type(self)()
+        pila: list[tuple[ArbolBinario[T], ArbolBinario[T]]] = [(self, nuevo)]
+        while pila:
+            origen, destino = pila.pop()
+            if not origen.es_vacio():
+                nodo = copy(origen.raiz)
+                nodo.si, nodo.sd = type(origen)(), type(origen)()
+                destino.set_raiz(nodo)
+                pila.append((origen.si(), nodo.si))
+                pila.append((origen.sd(), nodo.sd))
+        return nuevo
+
+    def _codificar(self) -> "tuple[list[T], bytes, type]":
+        # Preorder iterativo: los datos y, por cada nodo, que hijos tiene (bit 0: si, bit 1: sd).
+        # Asi pickle y deepcopy no recorren la estructura recursivamente y no se pasa el limite de recursion
+        datos: list[T] = []
+        forma = bytearray()
+        tipo_nodo = NodoAB if self.raiz is None else type(self.raiz)
+        pila: list[ArbolBinario[T]] = [self]
+        while pila:
+            actual = pila.pop()
+            if actual.es_vacio():
+                continue
+            si, sd = actual.si(), actual.sd()
+            datos.append(actual.dato())
+            forma.append((not si.es_vacio()) | (not sd.es_vacio()) << 1)
+            pila.append(sd)
+            pila.append(si)
+        return datos, bytes(forma), tipo_nodo
+
+    @classmethod
+    def _decodificar(cls, datos: list[T], forma: bytes, tipo_nodo: type) -> "ArbolBinario[T]":
+        # Se enlazan los nodos directamente, sin las validaciones de insertar (el arbol original ya era valido)
+        nuevo = cls()
+        pila: list[ArbolBinario[T]] = [nuevo]
+        for dato, hijos in zip(datos, forma):
+            actual = pila.pop()
+            nodo = tipo_nodo(dato)
+            actual.set_raiz(nodo)
+            if hijos & 2:
+                pila.append(nodo.sd)
+            if hijos & 1:
+                pila.append(nodo.si)
+        return nuevo
+
+    def __reduce__(self):
+        return (type(self)._decodificar, self._codificar())
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "ArbolBinario[T]":
+        datos, forma, tipo_nodo = self._codificar()
+        nuevo = self._decodificar(deepcopy(datos, memo), forma, tipo_nodo)
+        memo[id(self)] = nuevo
+        return nuevo
+
+    def _verificar_libre(self, subarbol: "ArbolBinario[T]", lado: int):
+        # Los caches se invalidan subiendo por _padre, que es uno solo: un subarbol no puede estar
+        # enlazado en dos arboles (ni en los dos lados del mismo)
+        if subarbol._padre is None or subarbol._padre == (self, lado):
+            return
+        padre, lado_padre = subarbol._padre
+        if padre._version is not None or (padre.raiz is not None and (padre.raiz.si, padre.raiz.sd)[lado_padre] is subarbol):
+            raise ValueError('El subarbol ya pertenece a otro arbol')
+
+    def _enlazar(self, anterior: "ArbolBinario[T]", nuevo: "ArbolBinario[T]", lado: int):
+        if anterior._padre is not None and anterior._padre[0] is self:
+            anterior._padre = None
+        nuevo._padre = (self, lado)
+        self._invalidar()
+
+    def _invalidar(self):
+        # Invariante: si un arbol tiene su cache sucio, tambien lo tienen todos sus ancestros
+        # (en las vistas lo garantiza _desdoblar, que limpia todo el camino hasta la raiz de la vista)
+        self._tam = self._alt = None
+        actual = self._padre[0] if self._padre is not None else None
+        while actual is not None and (actual._tam is not None or actual._alt is not None):
+            actual._tam = actual._alt = None
+            actual = actual._padre[0] if actual._padre is not None else None
+
+    def _actualizar_indice(self, anterior: "ArbolBinario[T]", nuevo: "ArbolBinario[T]", lado: int):
+        if not self._en_indice() or not self._indice.vigente:
+            return
+        if not anterior.es_vacio():
+            # Reemplazar un subarbol puede dejar entradas obsoletas: se reconstruye en la proxima consulta
+            self._indice.vigente = False
+        else:
+            nivel, camino = self._ubicacion
+            self._indice.registrar(nuevo, nivel + 1, camino + (lado,))
+
+    def _en_indice(self) -> bool:
+        # Si este arbol sigue registrado en el indice de _indice (y no quedo separado del arbol indexado)
+        return self._indice is not None and self._generacion == self._indice.generacion
+
+    def indexar(self):
+        # Un arbol con indice propio no puede ser parte de otro arbol indexado: las modificaciones
+        # solo se registran en uno de los dos indices
+        if self._indice is not None and self._indice.raiz is not self:
+            if not self._indice.vigente:
+                self._indice.reconstruir()
+            if self._en_indice():
+                raise ValueError('El arbol es parte de un arbol indexado: las consultas se hacen desde su raiz')
+        self._indice = IndiceAB(self)
+        self._indice.reconstruir()
+
+    def memoria_indice(self) -> int:
+        return self._indice.memoria() if self._indice is not None and self._indice.raiz is self else 0
 
-    def set_raiz(self, nodo: NodoAB[T]):
-        self.raiz = nodo
+    def _buscar(self, x: T) -> "Optional[tuple[ArbolBinario[T], int, tuple[int, ...]]]":
+        if self._indice is not None and self._indice.raiz is self:
+            return self._indice.buscar(x)
+        cola: deque[tuple[ArbolBinario[T], int, tuple[int, ...]]] = deque([(self, 1, ())])
+        while cola:
+            actual, nivel, camino = cola.popleft()
+            if not actual.es_vacio():
+                if actual.dato() == x:
+                    return actual, nivel, camino
+                cola.append((actual.si(), nivel + 1, camino + (0,)))
+                cola.append((actual.sd(), nivel + 1, camino + (1,)))
+        return None
+
+    def pertenece(self, x: T) -> bool:
+        return self._buscar(x) is not None
+
+    def camino(self, x: T) -> Optional[list[int]]:
+        encontrado = self._buscar(x)
+        return None if encontrado is None else list(encontrado[2])
         
+    def _calcular_tam_y_altura(self):
+        # Postorder iterativo (no depende de la pila de ejecucion): guarda en cada subarbol sin cache
+        # su cantidad de nodos y su altura. Cada entrada conserva sus hijos, porque los de una vista
+        # se crean a demanda y solo se recuerdan debilmente
+        pila: list[tuple[ArbolBinario[T], Optional[tuple[ArbolBinario[T], ArbolBinario[T]]]]] = [(self, None)]
+        while pila:
+            actual, hijos = pila.pop()
+            if actual._tam is not None and actual._alt is not None:
+                continue
+            if actual.es_vacio():
+                actual._tam, actual._alt = 0, 0
+            elif hijos is None:
+                hijos = (actual.si(), actual.sd())
+                pila.append((actual, hijos))
+                pila.append((hijos[1], None))
+                pila.append((hijos[0], None))
+            else:
+                si, sd = hijos
+                actual._tam = 1 + si._tam + sd._tam
+                actual._alt = 1 + max(si._alt, sd._alt)
+
     def altura(self) -> int:
-        if self.es_vacio():
-            return 0
-        else:
-            return 1 + max(self.si().altura(), self.sd().altura())
+        if self._alt is None:
+            self._calcular_tam_y_altura()
+        return self._alt
         
     def __len__(self) -> int:
-        if self.es_vacio():
-            return 0
-        else:
-            return 1 + len(self.si()) + len(self.sd())
+        if self._tam is None:
+            self._calcular_tam_y_altura()
+        return self._tam
     
-    def __str__(self):
-        def mostrar(t: ArbolBinario[T], nivel: int):
-            tab = '.' * 4
+    def escribir(self, destino: TextIO, max_nivel: Optional[int] = None, max_nodos: Optional[int] = None):
+        # Lo que no se escribe se resume en una sola marca: una por nodo cortado en max_nivel
+        # y una al alcanzar max_nodos, despues de la cual se termina
+        tab = '.' * 4
+        truncado = '<truncado>'
+        escritos = 0
+        # None marca los hijos omitidos de un nodo en max_nivel
+        pila: list[tuple[Optional[ArbolBinario[T]], int]] = [(self, 0)]
+        while pila:
+            t, nivel = pila.pop()
             indent = tab * nivel
-            if t.es_vacio():
-                return indent + 'AV\n'
+            if t is None or (max_nivel is not None and nivel >= max_nivel and not t.es_vacio()):
+                destino.write(indent + truncado + '\n')
+            elif t.es_vacio():
+                destino.write(indent + 'AV\n')
+            elif max_nodos is not None and escritos >= max_nodos:
+                destino.write(indent + truncado + '\n')
+                break
             else:
-                out = indent + str(t.dato()) + '\n'
-                out += mostrar(t.si(), nivel + 1)
-                out += mostrar(t.sd(), nivel + 1)
-                return out
-            
-        return mostrar(self, 0)
+                destino.write(indent + str(t.dato()) + '\n')
+                escritos += 1
+                if max_nivel is not None and nivel + 1 >= max_nivel and not t.es_hoja():
+                    pila.append((None, nivel + 1))
+                else:
+                    pila.append((t.sd(), nivel + 1))
+                    pila.append((t.si(), nivel + 1))
+
+    def __str__(self):
+        destino = io.StringIO()
+        self.escribir(destino)
+        return destino.getvalue()
 
     def inorder(self) -> list[T]:
         if self.es_vacio():
@@ -99,6 +459,18 @@ class ArbolBinario(Generic[T]):
         else:
             return self.si().inorder() + [self.dato()] + self.sd().inorder()
     
+    def __iter__(self) -> Iterator[T]:
+        # Inorder iterativo: no depende de la pila de ejecucion
+        pila: list[ArbolBinario[T]] = []
+        actual = self
+        while pila or not actual.es_vacio():
+            while not actual.es_vacio():
+                pila.append(actual)
+                actual = actual.si()
+            actual = pila.pop()
+            yield actual.dato()
+            actual = actual.sd()
+
     def inorder_tail(self) -> list[T]:
         pass
 
@@ -112,18 +484,85 @@ class ArbolBinario(Generic[T]):
         pass
 
     def nivel(self, x: T) -> int:
-        pass
+        encontrado = self._buscar(x)
+        return 0 if encontrado is None else encontrado[1]
+
+    def _copiar(self, espejado: bool) -> "ArbolBinario[T]":
+        version = _Version.nueva() if self._version is None else self._version
+        return self._vista(self.raiz, version, self._espejado != espejado, None)
 
     def copy(self) -> "ArbolBinario[T]":
-        pass
+        # O(1): la copia ve este arbol tal como esta ahora, aunque despues se lo modifique desde cualquier
+        # subarbol, y cada arbol copia solo el camino que modifica. El original no cambia de representacion.
+        return self._copiar(False)
 
     def espejo(self) -> "ArbolBinario[T]":
-        pass
+        return self._copiar(True)
         
     def sin_hojas(self):
-        pass
+        if self.es_hoja():
+            self.set_raiz(None)
+        elif not self.es_vacio():
+            self.si().sin_hojas()
+            self.sd().sin_hojas()
         
 
+def comparar_memoria_copias(altura: int = 14):
+    import tracemalloc
+
+    niveles = [ArbolBinario.crear_nodo(i) for i in range(2 ** (altura - 1))]
+    while len(niveles) > 1:
+        padres = []
+        for i in range(0, len(niveles), 2):
+            padre = ArbolBinario.crear_nodo(-i)
+            padre.insertar_si(niveles[i])
+            padre.insertar_sd(niveles[i + 1])
+            padres.append(padre)
+        niveles = padres
+    t = niveles[0]
+
+    for nombre, operacion in [('copy()', t.copy), ('espejo()', t.espejo), ('materializar()', t.materializar)]:
+        tracemalloc.start()
+        resultado = operacion()
+        resultado.sd().si().insertar_si(ArbolBinario.crear_nodo(0))
+        memoria = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f'{nombre:>15}: {memoria} bytes ({len(t)} nodos)')
+
+
+def comparar_serializacion(altura: int = 16, profundidad: int = 10 ** 5):
+    import copyreg
+    import pickle
+    import time
+
+    def pickle_por_defecto(t: ArbolBinario[int]) -> bytes:
+        # Lo que haria pickle sin __reduce__: guardar el __dict__ de cada objeto recursivamente
+        destino = io.BytesIO()
+        pickler = pickle.Pickler(destino, pickle.HIGHEST_PROTOCOL)
+        pickler.dispatch_table = {ArbolBinario: lambda a: (copyreg.__newobj__, (type(a),), a.__dict__)}
+        pickler.dump(t)
+        return destino.getvalue()
+
+    niveles = [ArbolBinario.crear_nodo(i) for i in range(2 ** (altura - 1))]
+    while len(niveles) > 1:
+        niveles = [ArbolBinario.crear_nodo(-i, niveles[i], niveles[i + 1]) for i in range(0, len(niveles), 2)]
+    balanceado = niveles[0]
+
+    degenerado = ArbolBinario.crear_nodo(0)
+    for i in range(1, profundidad):
+        degenerado = ArbolBinario.crear_nodo(i, degenerado)
+
+    for nombre, t in [(f'balanceado de altura {altura}', balanceado), (f'degenerado de profundidad {profundidad}', degenerado)]:
+        for metodo, serializar in [('por defecto', pickle_por_defecto), ('iterativo', pickle.dumps)]:
+            inicio = time.perf_counter()
+            try:
+                datos = serializar(t)
+                pickle.loads(datos)
+                print(f'{nombre:>32}, pickle {metodo:>11}: {len(datos)} bytes, {time.perf_counter() - inicio:.2f}s')
+            except RecursionError:
+                print(f'{nombre:>32}, pickle {metodo:>11}: RecursionError')
+
+
 def main():
     t = ArbolBinario.crear_nodo(1)
     n2 = ArbolBinario.crear_nodo(2)
@@ -158,6 +597,9 @@ def main():
     print(t3)
     print(t3.sin_hojas())
 
+    comparar_memoria_copias()
+    comparar_serializacion()
+
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
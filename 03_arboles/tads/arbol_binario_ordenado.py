@@ -1,4 +1,9 @@
-from typing import TypeVar, Optional, Protocol
+from collections.abc import Callable, Iterator
+from typing import Any, TypeVar, Optional, Protocol
+from functools import wraps
+from copy import copy
+import threading
+import numpy as np
 from arbol_binario import ArbolBinario, NodoAB
 
 class Comparable(Protocol):
@@ -27,6 +32,49 @@ class NodoABO(NodoAB[T]):
     
     
 class ArbolBinarioOrdenado(ArbolBinario[T]):
+    def __init__(self):
+        super().__init__()
+        self._escritura: Optional[threading.Lock] = None
+
+    class _Decoradores(ArbolBinario._Decoradores):
+        @classmethod
+        def exclusion_escritura(cls, f: Callable[..., Any]) -> Callable[..., Any]:
+            @wraps(f)
+            def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+                if self._escritura is None:
+                    return f(self, *args, **kwargs)
+                with self._escritura:
+                    return f(self, *args, **kwargs)
+            return wrapper
+
+    def habilitar_concurrencia(self):
+        # Un escritor a la vez; los lectores deben trabajar sobre snapshot() y nunca se bloquean
+        self._escritura = threading.Lock()
+
+    @_Decoradores.exclusion_escritura
+    def __reduce__(self):
+        # El Lock no se serializa: se guarda si el modo concurrente estaba habilitado y se crea uno nuevo
+        return (ArbolBinarioOrdenado._restaurar, (type(self), self._codificar(), self._escritura is not None))
+
+    @staticmethod
+    def _restaurar(cls: "type[ArbolBinarioOrdenado[T]]", codificado: "tuple[list[T], bytes, type]", concurrente: bool) -> "ArbolBinarioOrdenado[T]":
+        nuevo = cls._decodificar(*codificado)
+        if concurrente:
+            nuevo.habilitar_concurrencia()
+        return nuevo
+
+    @_Decoradores.exclusion_escritura
+    def __deepcopy__(self, memo: dict[int, Any]) -> "ArbolBinarioOrdenado[T]":
+        nuevo = super().__deepcopy__(memo)
+        if self._escritura is not None:
+            nuevo.habilitar_concurrencia()
+        return nuevo
+
+    @_Decoradores.exclusion_escritura
+    def snapshot(self) -> "ArbolBinarioOrdenado[T]":
+        # Version inmutable: el escritor copia el camino que modifica (copy-on-write) y no la altera
+        return self.copy()
+
     @staticmethod
     def crear_nodo(dato: T) -> "ArbolBinarioOrdenado[T]":
         nuevo = ArbolBinarioOrdenado()
@@ -47,6 +95,7 @@ class ArbolBinarioOrdenado(ArbolBinario[T]):
         
         return es_ordenado_interna(self)
     
+    @_Decoradores.exclusion_escritura
     def insertar_si(self, arbol: "ArbolBinarioOrdenado[T]"):
         si = self.si()
         super().insertar_si(arbol)
@@ -54,6 +103,7 @@ class ArbolBinarioOrdenado(ArbolBinario[T]):
             super().insertar_si(si)
             raise ValueError("El árbol a insertar no es ordenado o viola la propiedad de orden del árbol actual")
     
+    @_Decoradores.exclusion_escritura
     def insertar_sd(self, arbol: "ArbolBinarioOrdenado[T]"):
         sd = self.sd()
         super().insertar_sd(arbol)
@@ -61,22 +111,308 @@ class ArbolBinarioOrdenado(ArbolBinario[T]):
             super().insertar_sd(sd)
             raise ValueError("El árbol a insertar no es ordenado o viola la propiedad de orden del árbol actual")
     
+    @_Decoradores.exclusion_escritura
     def insertar(self, valor: T):
-        if self.es_vacio():
-            self.set_raiz(NodoABO(valor))
-        elif valor < self.dato():
-            self.si().insertar(valor)
-        else:
-            self.sd().insertar(valor)
+        # Iterativo: el cerrojo se toma una sola vez y no depende de la pila de ejecucion
+        actual = self
+        while not actual.es_vacio():
+            actual = actual.si() if valor < actual.dato() else actual.sd()
+        actual.set_raiz(NodoABO(valor))
 
     def pertenece(self, valor: T) -> bool:
-        pass
+        actual = self
+        while not actual.es_vacio():
+            if valor == actual.dato():
+                return True
+            actual = actual.si() if valor < actual.dato() else actual.sd()
+        return False
+
+    def _desde(self, desde: T) -> Iterator[T]:
+        # Inorder iterativo de los valores >= desde, descartando los subarboles menores
+        pila: list[ArbolBinarioOrdenado[T]] = []
+        actual = self
+        while pila or not actual.es_vacio():
+            while not actual.es_vacio():
+                if actual.dato() < desde:
+                    actual = actual.sd()
+                else:
+                    pila.append(actual)
+                    actual = actual.si()
+            if pila:
+                actual = pila.pop()
+                yield actual.dato()
+                actual = actual.sd()
+
+    def rango(self, desde: T, hasta: T) -> Iterator[T]:
+        # Valores en [desde, hasta)
+        for valor in self._desde(desde):
+            if valor >= hasta:
+                return
+            yield valor
+
+    def pertenece_muchos(self, claves: "list[T] | np.ndarray") -> np.ndarray:
+        resultado = np.zeros(len(claves), dtype=bool)
+        if len(claves) == 0 or self.es_vacio():
+            return resultado
+        if len(claves) * self.altura() < len(self):
+            # Pocas claves: conviene una busqueda por clave
+            for i, clave in enumerate(claves):
+                resultado[i] = self.pertenece(clave)
+            return resultado
+
+        # Muchas claves: se ordenan y se cruzan con un unico recorrido inorder a partir de la menor
+        arreglo = np.asarray(claves)
+        if arreglo.ndim != 1:
+            # Claves compuestas (por ejemplo tuplas): un objeto por clave, comparado con su propio orden
+            arreglo = np.fromiter(claves, dtype=object, count=len(claves))
+        orden = np.argsort(arreglo, kind='stable')
+        ordenadas = arreglo[orden].tolist()
+        i = 0
+        for valor in self._desde(ordenadas[0]):
+            while i < len(orden) and ordenadas[i] < valor:
+                i += 1
+            while i < len(orden) and ordenadas[i] == valor:
+                resultado[orden[i]] = True
+                i += 1
+            if i == len(orden):
+                break
+        return resultado
+
+    @staticmethod
+    def _con_hijos(dato: T, si: "ArbolBinarioOrdenado[T]", sd: "ArbolBinarioOrdenado[T]") -> "ArbolBinarioOrdenado[T]":
+        # Sin validar el orden: quien la invoca garantiza que si < dato <= sd
+        nuevo = ArbolBinarioOrdenado.crear_nodo(dato)
+        ArbolBinario.insertar_si(nuevo, si)
+        ArbolBinario.insertar_sd(nuevo, sd)
+        return nuevo
+
+    @staticmethod
+    def _desde_ordenados(valores: list[T]) -> "ArbolBinarioOrdenado[T]":
+        # Arbol balanceado en O(n) a partir de una lista ordenada (profundidad de recursion log n)
+        def construir(inicio: int, fin: int) -> ArbolBinarioOrdenado[T]:
+            if inicio >= fin:
+                return ArbolBinarioOrdenado()
+            medio = (inicio + fin) // 2
+            return ArbolBinarioOrdenado._con_hijos(valores[medio], construir(inicio, medio), construir(medio + 1, fin))
+
+        return construir(0, len(valores))
+
+    def _intercalar(self, otro: "ArbolBinarioOrdenado[T]", en_ambos: bool, solo_self: bool, solo_otro: bool) -> "ArbolBinarioOrdenado[T]":
+        # Merge de los dos recorridos inorder en O(m + n), luego se reconstruye balanceado
+        return ArbolBinarioOrdenado._desde_ordenados(self._intercalar_valores(otro, en_ambos, solo_self, solo_otro))
+
+    def _intercalar_valores(self, otro: "ArbolBinarioOrdenado[T]", en_ambos: bool, solo_self: bool, solo_otro: bool, repetidos: bool = False) -> list[T]:
+        resultado: list[T] = []
+        xs, ys = iter(self), iter(otro)
+        x, y = next(xs, None), next(ys, None)
+        while x is not None and y is not None:
+            if x < y:
+                if solo_self:
+                    resultado.append(x)
+                x = next(xs, None)
+            elif y < x:
+                if solo_otro:
+                    resultado.append(y)
+                y = next(ys, None)
+            else:
+                if en_ambos:
+                    resultado.append(x)
+                    if repetidos:
+                        resultado.append(y)
+                x, y = next(xs, None), next(ys, None)
+        while x is not None:
+            if solo_self:
+                resultado.append(x)
+            x = next(xs, None)
+        while y is not None:
+            if solo_otro:
+                resultado.append(y)
+            y = next(ys, None)
+        return resultado
+
+    def _dividir(self, valor: T) -> "tuple[ArbolBinarioOrdenado[T], bool, ArbolBinarioOrdenado[T]]":
+        # Menores a valor, si valor pertenece, y mayores. Solo se crean nodos nuevos sobre el camino
+        # recorrido; el resto se comparte con copy() (copy-on-write). Iterativo: se baja por el camino
+        # de valor y al volver se cuelga cada nodo del camino de menores o de mayores
+        camino: list[tuple[ArbolBinarioOrdenado[T], bool]] = []
+        actual = self
+        encontrado = False
+        while not actual.es_vacio():
+            if valor < actual.dato():
+                camino.append((actual, True))
+                actual = actual.si()
+            elif actual.dato() < valor:
+                camino.append((actual, False))
+                actual = actual.sd()
+            else:
+                encontrado = True
+                break
+        if encontrado:
+            menores, mayores = actual.si().copy(), actual.sd().copy()
+        else:
+            menores, mayores = ArbolBinarioOrdenado(), ArbolBinarioOrdenado()
+        for arbol, por_izquierda in reversed(camino):
+            if por_izquierda:
+                mayores = ArbolBinarioOrdenado._con_hijos(arbol.dato(), mayores, arbol.sd().copy())
+            else:
+                menores = ArbolBinarioOrdenado._con_hijos(arbol.dato(), arbol.si().copy(), menores)
+        return menores, encontrado, mayores
+
+    @staticmethod
+    def _concatenar(menores: "ArbolBinarioOrdenado[T]", mayores: "ArbolBinarioOrdenado[T]") -> "ArbolBinarioOrdenado[T]":
+        if menores.es_vacio():
+            return mayores
+        if mayores.es_vacio():
+            return menores
+        minimo = next(iter(mayores))
+        _, _, resto = mayores._dividir(minimo)
+        return ArbolBinarioOrdenado._con_hijos(minimo, menores, resto)
+
+    def _operar_dividiendo(self, otro: "ArbolBinarioOrdenado[T]", en_ambos: bool, solo_self: bool, solo_otro: bool) -> "ArbolBinarioOrdenado[T]":
+        # Divide y conquista sobre la raiz de self: O(m log(n/m + 1)) si ambos arboles estan balanceados.
+        # Con pila explicita, asi no depende de la pila de ejecucion aunque self este desbalanceado.
+        # Las uniones de _concatenar no rebalancean: al encadenar operaciones el resultado puede
+        # degenerar y conviene reconstruirlo con rebalancear()
+        resultados: list[ArbolBinarioOrdenado[T]] = []
+        # ('operar', subarbol de self, parte de otro) o ('combinar', dato, encontrado)
+        pila: list[tuple[Any, Any, Any]] = [('operar', self, otro)]
+        while pila:
+            paso, a, b = pila.pop()
+            if paso == 'operar':
+                if a.es_vacio():
+                    resultados.append(b.copy() if solo_otro else ArbolBinarioOrdenado())
+                elif b.es_vacio():
+                    resultados.append(a.copy() if solo_self else ArbolBinarioOrdenado())
+                else:
+                    menores, encontrado, mayores = b._dividir(a.dato())
+                    pila.append(('combinar', a.dato(), encontrado))
+                    pila.append(('operar', a.sd(), mayores))
+                    pila.append(('operar', a.si(), menores))
+            else:
+                derecha, izquierda = resultados.pop(), resultados.pop()
+                if (b and en_ambos) or (not b and solo_self):
+                    resultados.append(ArbolBinarioOrdenado._con_hijos(a, izquierda, derecha))
+                else:
+                    resultados.append(ArbolBinarioOrdenado._concatenar(izquierda, derecha))
+        return resultados[0]
+
+    # Con dividir=True el costo es O(m log(n/m + 1)) solo si los operandos estan balanceados; el
+    # resultado no se rebalancea (como con insertar), asi que tras encadenar operaciones conviene
+    # llamar a rebalancear()
+    def union(self, otro: "ArbolBinarioOrdenado[T]", dividir: bool = False) -> "ArbolBinarioOrdenado[T]":
+        if dividir:
+            return self._operar_dividiendo(otro, True, True, True)
+        return self._intercalar(otro, True, True, True)
+
+    def interseccion(self, otro: "ArbolBinarioOrdenado[T]", dividir: bool = False) -> "ArbolBinarioOrdenado[T]":
+        if dividir:
+            return self._operar_dividiendo(otro, True, False, False)
+        return self._intercalar(otro, True, False, False)
+
+    def diferencia(self, otro: "ArbolBinarioOrdenado[T]", dividir: bool = False) -> "ArbolBinarioOrdenado[T]":
+        if dividir:
+            return self._operar_dividiendo(otro, False, True, False)
+        return self._intercalar(otro, False, True, False)
+
+    def fusionar(self, otro: "ArbolBinarioOrdenado[T]") -> list[T]:
+        # Como la union pero conservando los valores repetidos. Un ABO no admite repetidos,
+        # asi que el resultado es la lista ordenada
+        return self._intercalar_valores(otro, True, True, True, repetidos=True)
 
     @staticmethod
     def convertir_ordenado(arbol_binario: ArbolBinario[T]) -> "ArbolBinarioOrdenado[T]":
-        pass
+        # Un unico ordenamiento O(n log n) y construccion balanceada; el recorrido es iterativo.
+        # Un ABO no admite repetidos: se conserva una aparicion de cada valor
+        valores = sorted(iter(arbol_binario))
+        unicos = [valor for i, valor in enumerate(valores) if i == 0 or valores[i - 1] != valor]
+        return ArbolBinarioOrdenado._desde_ordenados(unicos)
+
+    @staticmethod
+    def _rotar_derecha(arbol: "ArbolBinarioOrdenado[T]"):
+        # Los nodos enlazados no se modifican: se crean los dos nodos rotados, se reasignan las raices
+        # y los padres, y se limpian los caches afectados
+        arbol._desdoblar()
+        a = arbol.raiz
+        izquierdo = a.si
+        izquierdo._desdoblar()
+        b = izquierdo.raiz
+        nuevo_a, nuevo_b = copy(a), copy(b)
+        nuevo_a.si, nuevo_b.sd = b.sd, izquierdo
+        izquierdo._asignar(nuevo_a)
+        arbol._asignar(nuevo_b)
+        nuevo_b.si._padre, nuevo_b.sd._padre = (arbol, 0), (arbol, 1)
+        nuevo_a.si._padre, nuevo_a.sd._padre = (izquierdo, 0), (izquierdo, 1)
+        arbol._tam = arbol._alt = izquierdo._tam = izquierdo._alt = None
+
+    @staticmethod
+    def _rotar_izquierda(arbol: "ArbolBinarioOrdenado[T]"):
+        arbol._desdoblar()
+        a = arbol.raiz
+        derecho = a.sd
+        derecho._desdoblar()
+        b = derecho.raiz
+        nuevo_a, nuevo_b = copy(a), copy(b)
+        nuevo_a.sd, nuevo_b.si = b.si, derecho
+        derecho._asignar(nuevo_a)
+        arbol._asignar(nuevo_b)
+        nuevo_b.si._padre, nuevo_b.sd._padre = (arbol, 0), (arbol, 1)
+        nuevo_a.si._padre, nuevo_a.sd._padre = (derecho, 0), (derecho, 1)
+        arbol._tam = arbol._alt = derecho._tam = derecho._alt = None
+
+    @_Decoradores.exclusion_escritura
+    def rebalancear(self):
+        # Day-Stout-Warren: O(n) tiempo y O(1) espacio extra, sin recursion
+        # 1. Rotaciones a derecha hasta dejar una "enredadera" (lista enlazada por sd)
+        cantidad = 0
+        actual = self
+        while True:
+            actual._desdoblar()
+            if actual.es_vacio():
+                break
+            actual._tam = actual._alt = None
+            if actual.raiz.si.es_vacio():
+                cantidad += 1
+                actual = actual.raiz.sd
+            else:
+                ArbolBinarioOrdenado._rotar_derecha(actual)
+
+        # 2. Rotaciones a izquierda sobre nodos alternados hasta obtener un arbol completo
+        def comprimir(rotaciones: int):
+            actual = self
+            for _ in range(rotaciones):
+                ArbolBinarioOrdenado._rotar_izquierda(actual)
+                actual = actual.raiz.sd
+
+        hojas = cantidad + 1 - 2 ** ((cantidad + 1).bit_length() - 1)
+        comprimir(hojas)
+        cantidad -= hojas
+        while cantidad > 1:
+            cantidad //= 2
+            comprimir(cantidad)
+
+        self._invalidar()
+        if self._indice is not None:
+            self._indice.vigente = False
         
 
+def comparar_pertenece_muchos(n: int = 20000, m: int = 50000):
+    import random
+    import time
+
+    valores = random.sample(range(10 * n), n)
+    arbol = ArbolBinarioOrdenado._desde_ordenados(sorted(valores))
+    claves = [random.randrange(10 * n) for _ in range(m)]
+
+    inicio = time.perf_counter()
+    por_clave = [arbol.pertenece(clave) for clave in claves]
+    tiempo_por_clave = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    en_lote = arbol.pertenece_muchos(claves)
+    tiempo_en_lote = time.perf_counter() - inicio
+    assert por_clave == list(en_lote)
+    print(f'{m} claves sobre {n} nodos: por clave {tiempo_por_clave:.3f}s, en lote {tiempo_en_lote:.3f}s')
+
+
 def main():
     t: ArbolBinarioOrdenado[int] = ArbolBinarioOrdenado()
     t.insertar(10)
@@ -100,6 +436,9 @@ def main():
     print(f'Ordenado?: {t.es_ordenado()}')
 
     print(f'Tiene 12: {t.pertenece(12)}')
+    print(f'Tienen 12, 3, 20: {t.pertenece_muchos([12, 3, 20])}')
+
+    comparar_pertenece_muchos()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,29 +1,45 @@
-from typing import Generic, TypeVar
+from array import array
+from collections.abc import Iterator
+from copy import deepcopy
+from typing import Any, Generic, Optional, TextIO, TypeVar
+import io
 
 T = TypeVar('T')
 S = TypeVar('S')
 
+# Tipos de hoja que se pueden guardar en un array compacto y su codigo de tipo
+CODIGOS_COMPACTOS: dict[type, str] = {int: 'q', float: 'd'}
+
 class ArbolH(Generic[T, S]):
     def __init__(self, dato: T | S):
         self._dato: T | S = dato
         self._subarboles: list[ArbolH[T, S]] = []
         self._tipo_hoja = type(dato)
         self._tipo_nodo = None
+        # En modo compacto las hojas del nodo son solo datos en un array, sin un ArbolH por hoja
+        self._hojas_compactas: Optional[array] = None
     
     @staticmethod
-    def crear_nodo_y_hojas(dato_raiz: S, *datos_hojas: T) -> "ArbolH[T, S]":
+    def crear_nodo_y_hojas(dato_raiz: S, *datos_hojas: T, compacto: bool = False) -> "ArbolH[T, S]":
         if not datos_hojas:
             raise ValueError("Se requiere al menos un dato para las hojas")
-        if (not all([isinstance(dato, type(datos_hojas[0])) for dato in datos_hojas])):
+        if (not all(isinstance(dato, type(datos_hojas[0])) for dato in datos_hojas)):
             raise ValueError("Todos los datos de las hojas deben ser del mismo tipo")
         
         nuevo = ArbolH(dato_raiz)
+        nuevo._tipo_nodo = type(dato_raiz)
+        nuevo._tipo_hoja = type(datos_hojas[0])
+        codigo = CODIGOS_COMPACTOS.get(nuevo._tipo_hoja)
+        if compacto and codigo is not None and all(type(dato) is nuevo._tipo_hoja for dato in datos_hojas):
+            try:
+                nuevo._hojas_compactas = array(codigo, datos_hojas)
+                return nuevo
+            except OverflowError:
+                pass    # enteros que no entran en 64 bits: se guardan como nodos
         for dato in datos_hojas:
             subarbol = ArbolH(dato)
             subarbol._tipo_nodo = type(dato_raiz)
             nuevo._subarboles.append(subarbol)
-        nuevo._tipo_nodo = type(dato_raiz)
-        nuevo._tipo_hoja = type(datos_hojas[0])
         return nuevo
 
     def dato_hoja(self) -> T:
@@ -38,11 +54,83 @@ class ArbolH(Generic[T, S]):
     
     @property
     def subarboles(self) -> "list[ArbolH[T,S]]":
+        # Quien pide los subárboles puede modificarlos, por eso se crean los nodos de las hojas compactas
+        self.descompactar()
         return self._subarboles
 
+    def es_compacto(self) -> bool:
+        return self._hojas_compactas is not None
+
+    def descompactar(self) -> None:
+        if self._hojas_compactas is None:
+            return
+        for dato in self._hojas_compactas:
+            subarbol = type(self)(dato)
+            subarbol._tipo_nodo = self._tipo_nodo
+            self._subarboles.append(subarbol)
+        self._hojas_compactas = None
+
+    def hojas(self) -> Iterator[T]:
+        # Datos de todas las hojas en preorder; las hojas compactas se recorren directamente sobre el array
+        pila: list[ArbolH[T,S]] = [self]
+        while pila:
+            t = pila.pop()
+            if t._hojas_compactas is not None:
+                yield from t._hojas_compactas
+            elif t.es_hoja():
+                yield t._dato
+            else:
+                pila.extend(reversed(t._subarboles))
+
+    def _codificar(self) -> "tuple[list[T | S], list[int | array], list[tuple[Any, Any]]]":
+        # Preorder iterativo: por nodo, su dato, sus hijos (cantidad o el array de hojas compactas) y sus tipos
+        datos: list[T | S] = []
+        hijos: list[int | array] = []
+        tipos: list[tuple[Any, Any]] = []
+        pila: list[ArbolH[T,S]] = [self]
+        while pila:
+            actual = pila.pop()
+            datos.append(actual._dato)
+            hijos.append(actual._hojas_compactas if actual._hojas_compactas is not None else len(actual._subarboles))
+            tipos.append((actual._tipo_nodo, actual._tipo_hoja))
+            pila.extend(reversed(actual._subarboles))
+        return datos, hijos, tipos
+
+    @classmethod
+    def _decodificar(cls, datos: "list[T | S]", hijos: "list[int | array]", tipos: list[tuple[Any, Any]]) -> "ArbolH[T, S]":
+        # Pila de [arbol, hijos que le faltan]
+        pila: list[list[Any]] = []
+        nuevo: Optional[ArbolH[T, S]] = None
+        for dato, cantidad, (tipo_nodo, tipo_hoja) in zip(datos, hijos, tipos):
+            actual = cls(dato)
+            if nuevo is None:
+                nuevo = actual
+            else:
+                while pila[-1][1] == 0:
+                    pila.pop()
+                pila[-1][1] -= 1
+                pila[-1][0]._insertar_subarbol_nocheck(actual)
+            actual._tipo_nodo, actual._tipo_hoja = tipo_nodo, tipo_hoja
+            if isinstance(cantidad, array):
+                actual._hojas_compactas = array(cantidad.typecode, cantidad)
+            else:
+                pila.append([actual, cantidad])
+        assert nuevo is not None
+        return nuevo
+
+    def __reduce__(self):
+        return (type(self)._decodificar, self._codificar())
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "ArbolH[T, S]":
+        datos, hijos, tipos = self._codificar()
+        nuevo = self._decodificar(deepcopy(datos, memo), hijos, tipos)
+        memo[id(self)] = nuevo
+        return nuevo
+
     def _insertar_subarbol_nocheck(self, subarbol: "ArbolH[T,S]") -> None:
         subarbol._tipo_nodo = self._tipo_nodo
-        self.subarboles.append(subarbol)
+        self.descompactar()
+        self._subarboles.append(subarbol)
 
     def insertar_subarbol(self, subarbol: "ArbolH[T,S]")-> None:
         if self.es_hoja():
@@ -53,22 +141,49 @@ class ArbolH(Generic[T, S]):
         self._insertar_subarbol_nocheck(subarbol)
 
     def es_hoja(self) -> bool:
-        return self.subarboles == []
+        return not self._subarboles and self._hojas_compactas is None
     
-    def __str__(self) -> str:
-        def mostrar(t: ArbolH[T,S], nivel: int):
-            tab = '.' * 4
+    def escribir(self, destino: TextIO, max_nivel: Optional[int] = None, max_nodos: Optional[int] = None):
+        # Lo que no se escribe se resume en una sola marca: una por nodo cortado en max_nivel
+        # y una al alcanzar max_nodos, despues de la cual se termina
+        tab = '.' * 4
+        truncado = '<truncado>'
+        escritos = 0
+        # Cada entrada es (subárbol, nivel), (dato de una hoja compacta, nivel, True)
+        # o (None, nivel) para las hojas omitidas de un nodo en max_nivel
+        pila: list[tuple[Any, ...]] = [(self, 0)]
+        while pila:
+            entrada = pila.pop()
+            nivel = entrada[1]
             indent = tab * nivel
-            if t.es_hoja():
+            if entrada[0] is None or (max_nivel is not None and nivel >= max_nivel):
+                destino.write(f'{indent} {truncado} \n')
+                continue
+            if max_nodos is not None and escritos >= max_nodos:
+                destino.write(f'{indent} {truncado} \n')
+                break
+            t = entrada[0]
+            if len(entrada) == 3:
+                dato = f'[{t}]'
+            elif t.es_hoja():
                 dato = f'[{t.dato_hoja()}]'
             else:
                 dato = str(t.dato_nodo())
-            out = f'{indent} {dato} \n'
-            for subarbol in t.subarboles:
-                out += mostrar(subarbol, nivel + 1)
-            return out
-            
-        return mostrar(self, 0)
+            destino.write(f'{indent} {dato} \n')
+            escritos += 1
+            if len(entrada) == 3 or t.es_hoja():
+                continue
+            if max_nivel is not None and nivel + 1 >= max_nivel:
+                pila.append((None, nivel + 1))
+            elif t._hojas_compactas is not None:
+                pila.extend((hoja, nivel + 1, True) for hoja in reversed(t._hojas_compactas))
+            else:
+                pila.extend((subarbol, nivel + 1) for subarbol in reversed(t._subarboles))
+
+    def __str__(self) -> str:
+        destino = io.StringIO()
+        self.escribir(destino)
+        return destino.getvalue()
 
     def _son_mismos_tipos(self, otro: "ArbolH[T,S]") -> bool:
         return (
@@ -78,8 +193,32 @@ class ArbolH(Generic[T, S]):
         )
     
     def es_valido(self) -> bool:
-        pass
-        
+        # Una sola pasada con pila explicita: todos los nodos intermedios deben tener datos del mismo tipo
+        # y todas las hojas tambien (el de las hojas compactas lo fija el codigo del array)
+        tipo_nodo: Optional[type] = None
+        tipo_hoja: Optional[type] = None
+        pila: list[ArbolH[T,S]] = [self]
+        while pila:
+            t = pila.pop()
+            if t.es_hoja():
+                tipos_hojas = [type(t._dato)]
+            else:
+                if tipo_nodo is None:
+                    tipo_nodo = type(t._dato)
+                elif type(t._dato) is not tipo_nodo:
+                    return False
+                if t._hojas_compactas is not None:
+                    tipos_hojas = [int if t._hojas_compactas.typecode == 'q' else float]
+                else:
+                    tipos_hojas = []
+                    pila.extend(t._subarboles)
+            for tipo in tipos_hojas:
+                if tipo_hoja is None:
+                    tipo_hoja = tipo
+                elif tipo is not tipo_hoja:
+                    return False
+        return True
+
 
 def main():
     nodo_b = ArbolH.crear_nodo_y_hojas('b', 6, 7)
@@ -90,8 +229,26 @@ def main():
     nodo_c.insertar_subarbol(ArbolH(10))
     print(arbol)
 
+    print(f'Es valido: {arbol.es_valido()}')
+
     nodo_int = ArbolH.crear_nodo_y_hojas(1, 2, 3)
     # arbol.insertar_subarbol(nodo_int)  # Debería lanzar una excepción
 
+    comparar_memoria_compacta()
+
+def comparar_memoria_compacta(cantidad: int = 10 ** 5):
+    import time
+    import tracemalloc
+
+    for compacto in (False, True):
+        tracemalloc.start()
+        arbol = ArbolH.crear_nodo_y_hojas('raiz', *range(cantidad), compacto=compacto)
+        memoria = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        inicio = time.perf_counter()
+        total = sum(arbol.hojas())
+        tiempo = time.perf_counter() - inicio
+        print(f'{"Compacto" if compacto else "Un nodo por hoja":>16}: {memoria / 2 ** 20:.1f} MiB, suma de {cantidad} hojas ({total}) en {tiempo * 1000:.1f}ms')
+
 if __name__ == '__main__':
     main()
@@ -1,12 +1,176 @@
-from typing import Generic, TypeVar
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Generic, Optional, TextIO, TypeVar
+from copy import deepcopy
 from functools import reduce
+from itertools import islice
+from operator import add
+import io
+import os
+import sys
+import numpy as np
 
 T = TypeVar('T')
+R = TypeVar('R')
+
+class IndiceN(Generic[T]):
+    def __init__(self, raiz: "ArbolN[T]"):
+        self.raiz = raiz
+        self.entradas: dict[T, tuple[ArbolN[T], int, tuple[int, ...]]] = {}
+        self.vigente = False
+        # Cada reconstruccion es una generacion nueva: los subarboles que ya no estan en el arbol
+        # conservan una generacion vieja y no registran nada en el indice
+        self.generacion = 0
+
+    def registrar(self, subarbol: "ArbolN[T]", nivel: int, camino: tuple[int, ...]):
+        # BFS: ante valores repetidos queda registrada la aparicion mas cercana a la raiz
+        cola = deque([(subarbol, nivel, camino)])
+        while cola:
+            actual, nivel, camino = cola.popleft()
+            actual._indice = self
+            actual._ubicacion = (nivel, camino)
+            actual._generacion = self.generacion
+            registrado = self.entradas.get(actual.dato)
+            if registrado is None or registrado[1] > nivel:
+                self.entradas[actual.dato] = (actual, nivel, camino)
+            for i, hijo in enumerate(actual.subarboles):
+                cola.append((hijo, nivel + 1, camino + (i,)))
+
+    def reconstruir(self):
+        self.entradas.clear()
+        self.generacion += 1
+        self.registrar(self.raiz, 1, ())
+        self.vigente = True
+
+    def buscar(self, x: T) -> "Optional[tuple[ArbolN[T], int, tuple[int, ...]]]":
+        if not self.vigente:
+            self.reconstruir()
+        return self.entradas.get(x)
+
+    def memoria(self) -> int:
+        return sys.getsizeof(self.entradas) + sum(
+            sys.getsizeof(entrada) + sys.getsizeof(entrada[2]) for entrada in self.entradas.values()
+        )
+
+
+class AncestrosN(Generic[T]):
+    # Preprocesamiento de un arbol estatico: recorrido de Euler + sparse table de minimos.
+    # Si el arbol se modifica hay que volver a preprocesar.
+    def __init__(self, arbol: "ArbolN[T]"):
+        datos: list[T] = []
+        profundidades: list[int] = []
+        euler: list[int] = []
+        entrada: list[int] = []
+        salida: list[int] = []
+        primera: list[int] = []
+        reloj = 0
+        # Cada nodo se apila dos veces: (arbol, profundidad, padre) para entrar y (None, nodo, padre) para salir
+        pila: list[tuple[Optional[ArbolN[T]], int, int]] = [(arbol, 0, -1)]
+        while pila:
+            actual, profundidad, padre = pila.pop()
+            if actual is None:
+                salida[profundidad] = reloj
+                reloj += 1
+                if padre >= 0:
+                    euler.append(padre)
+                continue
+            nuevo = len(datos)
+            datos.append(actual.dato)
+            profundidades.append(profundidad)
+            entrada.append(reloj)
+            salida.append(reloj)
+            reloj += 1
+            primera.append(len(euler))
+            euler.append(nuevo)
+            pila.append((None, nuevo, padre))
+            for hijo in reversed(actual.subarboles):
+                pila.append((hijo, profundidad + 1, nuevo))
+
+        self.datos = datos
+        # Arreglo 1-D de objetos para indexar con los resultados vectorizados (np.array convertiria las tuplas en filas)
+        self._datos_objeto = np.empty(len(datos), dtype=object)
+        for i, dato in enumerate(datos):
+            self._datos_objeto[i] = dato
+        self.posiciones: dict[T, int] = {}
+        for i, dato in enumerate(datos):
+            self.posiciones.setdefault(dato, i)
+        self.profundidad = np.array(profundidades, dtype=np.int64)
+        self.entrada = np.array(entrada, dtype=np.int64)
+        self.salida = np.array(salida, dtype=np.int64)
+        self.euler = np.array(euler, dtype=np.int64)
+        self.primera = np.array(primera, dtype=np.int64)
+
+        # tabla[k][i]: posicion del recorrido de Euler con menor profundidad en [i, i + 2^k)
+        prof_euler = self.profundidad[self.euler]
+        self.tabla = [np.arange(len(self.euler), dtype=np.int64)]
+        k = 1
+        while (1 << k) <= len(self.euler):
+            previa = self.tabla[-1]
+            izq = previa[:len(previa) - (1 << (k - 1))]
+            der = previa[(1 << (k - 1)):]
+            self.tabla.append(np.where(prof_euler[izq] <= prof_euler[der], izq, der))
+            k += 1
+
+    def _posicion(self, x: T) -> int:
+        if x not in self.posiciones:
+            raise ValueError(f'{x} no pertenece al arbol')
+        return self.posiciones[x]
+
+    def _lca_posiciones(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        i = np.minimum(self.primera[a], self.primera[b])
+        j = np.maximum(self.primera[a], self.primera[b])
+        k = np.floor(np.log2(j - i + 1)).astype(np.int64)
+        resultado = np.empty(len(i), dtype=np.int64)
+        for nivel in np.unique(k):
+            mascara = k == nivel
+            izq = self.tabla[nivel][i[mascara]]
+            der = self.tabla[nivel][j[mascara] - (1 << int(nivel)) + 1]
+            prof_izq = self.profundidad[self.euler[izq]]
+            prof_der = self.profundidad[self.euler[der]]
+            resultado[mascara] = self.euler[np.where(prof_izq <= prof_der, izq, der)]
+        return resultado
+
+    def lca(self, a: T, b: T) -> T:
+        i = self.primera[self._posicion(a)]
+        j = self.primera[self._posicion(b)]
+        if i > j:
+            i, j = j, i
+        k = (int(j - i) + 1).bit_length() - 1
+        izq = self.tabla[k][i]
+        der = self.tabla[k][j - (1 << k) + 1]
+        minimo = izq if self.profundidad[self.euler[izq]] <= self.profundidad[self.euler[der]] else der
+        return self.datos[self.euler[minimo]]
+
+    def es_ancestro(self, a: T, b: T) -> bool:
+        i, j = self._posicion(a), self._posicion(b)
+        return bool(self.entrada[i] <= self.entrada[j] and self.salida[j] <= self.salida[i])
+
+    def distancia(self, a: T, b: T) -> int:
+        ancestro = self._posicion(self.lca(a, b))
+        return int(self.profundidad[self._posicion(a)] + self.profundidad[self._posicion(b)] - 2 * self.profundidad[ancestro])
+
+    def lca_muchos(self, pares: list[tuple[T, T]]) -> np.ndarray:
+        a = np.array([self._posicion(x) for x, _ in pares], dtype=np.int64)
+        b = np.array([self._posicion(y) for _, y in pares], dtype=np.int64)
+        return self._datos_objeto[self._lca_posiciones(a, b)]
+
+    def es_ancestro_muchos(self, pares: list[tuple[T, T]]) -> np.ndarray:
+        a = np.array([self._posicion(x) for x, _ in pares], dtype=np.int64)
+        b = np.array([self._posicion(y) for _, y in pares], dtype=np.int64)
+        return (self.entrada[a] <= self.entrada[b]) & (self.salida[b] <= self.salida[a])
+
 
 class ArbolN(Generic[T]):
     def __init__(self, dato: T):
         self._dato: T = dato
         self._subarboles: list[ArbolN[T]] = []
+        self._indice: Optional[IndiceN[T]] = None
+        self._ubicacion: tuple[int, tuple[int, ...]] = (1, ())
+        self._generacion: int = 0
+        self._padre: Optional[ArbolN[T]] = None
+        self._tam: Optional[int] = None
+        self._alt: Optional[int] = None
        
     @property
     def dato(self) -> T:
@@ -15,20 +179,99 @@ class ArbolN(Generic[T]):
     @dato.setter
     def dato(self, valor: T):
         self._dato = valor
+        if self._en_indice():
+            self._indice.vigente = False
 
     @property
-    def subarboles(self) -> "list[ArbolN[T]]":
-        return self._subarboles
+    def subarboles(self) -> "tuple[ArbolN[T], ...]":
+        # Tupla: los cambios pasan por insertar_subarbol o el setter, que invalidan los caches y el indice
+        return tuple(self._subarboles)
     
     @subarboles.setter
     def subarboles(self, subarboles: "list[ArbolN[T]]"):
-        self._subarboles = subarboles
+        nuevos = list(subarboles)
+        if len({id(subarbol) for subarbol in nuevos}) != len(nuevos):
+            raise ValueError('Un subarbol no puede aparecer dos veces')
+        for subarbol in nuevos:
+            if subarbol._padre is not self:
+                self._verificar_libre(subarbol)
+        for anterior in self._subarboles:
+            if anterior._padre is self:
+                anterior._padre = None
+        self._subarboles = nuevos
+        for subarbol in nuevos:
+            subarbol._padre = self
+        self._invalidar()
+        if self._en_indice():
+            self._indice.vigente = False
 
     def insertar_subarbol(self, subarbol: "ArbolN[T]"):
-        self.subarboles.append(subarbol)
+        self._verificar_libre(subarbol)
+        self._subarboles.append(subarbol)
+        subarbol._padre = self
+        self._invalidar()
+        if self._en_indice() and self._indice.vigente:
+            nivel, camino = self._ubicacion
+            self._indice.registrar(subarbol, nivel + 1, camino + (len(self._subarboles) - 1,))
+
+    @staticmethod
+    def _verificar_libre(subarbol: "ArbolN[T]"):
+        # Los caches se invalidan subiendo por _padre, que es uno solo: un subarbol no puede colgar
+        # de dos arboles (ni dos veces del mismo)
+        padre = subarbol._padre
+        if padre is not None and any(hijo is subarbol for hijo in padre._subarboles):
+            raise ValueError('El subarbol ya pertenece a otro arbol')
+
+    def _invalidar(self):
+        # Invariante: si un arbol tiene su cache sucio, tambien lo tienen todos sus ancestros
+        self._tam = self._alt = None
+        actual = self._padre
+        while actual is not None and (actual._tam is not None or actual._alt is not None):
+            actual._tam = actual._alt = None
+            actual = actual._padre
+
+    def _en_indice(self) -> bool:
+        # Si este arbol sigue registrado en el indice de _indice (y no quedo separado del arbol indexado)
+        return self._indice is not None and self._generacion == self._indice.generacion
+
+    def indexar(self):
+        # Un arbol con indice propio no puede ser parte de otro arbol indexado: las modificaciones
+        # solo se registran en uno de los dos indices
+        if self._indice is not None and self._indice.raiz is not self:
+            if not self._indice.vigente:
+                self._indice.reconstruir()
+            if self._en_indice():
+                raise ValueError('El arbol es parte de un arbol indexado: las consultas se hacen desde su raiz')
+        self._indice = IndiceN(self)
+        self._indice.reconstruir()
+
+    def memoria_indice(self) -> int:
+        return self._indice.memoria() if self._indice is not None and self._indice.raiz is self else 0
+
+    def _buscar(self, x: T) -> "Optional[tuple[ArbolN[T], int, tuple[int, ...]]]":
+        if self._indice is not None and self._indice.raiz is self:
+            return self._indice.buscar(x)
+        cola: deque[tuple[ArbolN[T], int, tuple[int, ...]]] = deque([(self, 1, ())])
+        while cola:
+            actual, nivel, camino = cola.popleft()
+            if actual.dato == x:
+                return actual, nivel, camino
+            for i, hijo in enumerate(actual.subarboles):
+                cola.append((hijo, nivel + 1, camino + (i,)))
+        return None
+
+    def pertenece(self, x: T) -> bool:
+        return self._buscar(x) is not None
+
+    def preprocesar_ancestros(self) -> AncestrosN[T]:
+        return AncestrosN(self)
+
+    def camino(self, x: T) -> Optional[list[int]]:
+        encontrado = self._buscar(x)
+        return None if encontrado is None else list(encontrado[2])
 
     def es_hoja(self) -> bool:
-        return self.subarboles == []
+        return not self._subarboles
     
     def altura(self) -> int:
         def altura_n(bosque: list[ArbolN[T]]) -> int:
@@ -37,24 +280,46 @@ class ArbolN(Generic[T]):
             else:
                 return max(bosque[0].altura(), altura_n(bosque[1:]))
         
-        return 1 + altura_n(self.subarboles)
+        if self._alt is None:
+            self._alt = 1 + altura_n(self.subarboles)
+        return self._alt
         
     def __len__(self) -> int:
-        if self.es_hoja():
-            return 1
-        else:
-            return 1 + sum([len(subarbol) for subarbol in self.subarboles])
+        if self._tam is None:
+            if self.es_hoja():
+                self._tam = 1
+            else:
+                self._tam = 1 + sum([len(subarbol) for subarbol in self.subarboles])
+        return self._tam
 
-    def __str__(self):
-        def mostrar(t: ArbolN[T], nivel: int):
-            tab = '.' * 4
+    def escribir(self, destino: TextIO, max_nivel: Optional[int] = None, max_nodos: Optional[int] = None):
+        # Lo que no se escribe se resume en una sola marca: una por nodo cortado en max_nivel
+        # y una al alcanzar max_nodos, despues de la cual se termina
+        tab = '.' * 4
+        truncado = '<truncado>'
+        escritos = 0
+        # None marca los subarboles omitidos de un nodo en max_nivel
+        pila: list[tuple[Optional[ArbolN[T]], int]] = [(self, 0)]
+        while pila:
+            t, nivel = pila.pop()
             indent = tab * nivel
-            out = indent + str(t.dato) + '\n'
-            for subarbol in t.subarboles:
-                out += mostrar(subarbol, nivel + 1)
-            return out
-            
-        return mostrar(self, 0)
+            if t is None or (max_nivel is not None and nivel >= max_nivel):
+                destino.write(indent + truncado + '\n')
+            elif max_nodos is not None and escritos >= max_nodos:
+                destino.write(indent + truncado + '\n')
+                break
+            else:
+                destino.write(indent + str(t.dato) + '\n')
+                escritos += 1
+                if max_nivel is not None and nivel + 1 >= max_nivel and t._subarboles:
+                    pila.append((None, nivel + 1))
+                else:
+                    pila.extend((subarbol, nivel + 1) for subarbol in reversed(t._subarboles))
+
+    def __str__(self):
+        destino = io.StringIO()
+        self.escribir(destino)
+        return destino.getvalue()
 
     def preorder(self) -> list[T]:
         return reduce(lambda recorrido, subarbol: recorrido + subarbol.preorder(), self.subarboles, [self.dato])
@@ -70,6 +335,66 @@ class ArbolN(Generic[T]):
             return [] if not bosque else bosque[0].preorder3() + preorder_n(bosque[1:])
         return [self.dato] + preorder_n(self.subarboles)
     
+    def _datos_preorder(self) -> list[T]:
+        # Serializacion compacta e iterativa: solo los datos en preorder, sin recursion
+        datos: list[T] = []
+        pila: list[ArbolN[T]] = [self]
+        while pila:
+            actual = pila.pop()
+            datos.append(actual.dato)
+            pila.extend(reversed(actual.subarboles))
+        return datos
+
+    def _codificar(self) -> "tuple[list[T], list[int]]":
+        # Datos en preorder y la cantidad de hijos de cada nodo: pickle y deepcopy no recorren la estructura recursivamente
+        datos: list[T] = []
+        cantidades: list[int] = []
+        pila: list[ArbolN[T]] = [self]
+        while pila:
+            actual = pila.pop()
+            datos.append(actual.dato)
+            cantidades.append(len(actual.subarboles))
+            pila.extend(reversed(actual.subarboles))
+        return datos, cantidades
+
+    @classmethod
+    def _decodificar(cls, datos: list[T], cantidades: list[int]) -> "ArbolN[T]":
+        nuevo = cls(datos[0])
+        # Pila de [arbol, hijos que le faltan]
+        pila: list[list[Any]] = [[nuevo, cantidades[0]]]
+        for dato, cantidad in islice(zip(datos, cantidades), 1, None):
+            while pila[-1][1] == 0:
+                pila.pop()
+            pila[-1][1] -= 1
+            subarbol = cls(dato)
+            pila[-1][0].insertar_subarbol(subarbol)
+            pila.append([subarbol, cantidad])
+        return nuevo
+
+    def __reduce__(self):
+        return (type(self)._decodificar, self._codificar())
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "ArbolN[T]":
+        datos, cantidades = self._codificar()
+        nuevo = self._decodificar(deepcopy(datos, memo), cantidades)
+        memo[id(self)] = nuevo
+        return nuevo
+
+    def map_reduce(self, f: Callable[[T], R], combinar: Callable[[R, R], R], workers: Optional[int] = None) -> R:
+        # combinar debe ser asociativa; f y combinar deben poder enviarse a otro proceso (funciones de modulo)
+        workers = (os.cpu_count() or 1) if workers is None else workers
+        subarboles = self._subarboles
+        if workers <= 1 or len(subarboles) < 2:
+            return reduce(combinar, map(f, self._datos_preorder()))
+
+        # Agrupamos subarboles contiguos para conservar el orden del recorrido
+        tamanio = -(-len(subarboles) // workers)
+        grupos = [subarboles[i:i + tamanio] for i in range(0, len(subarboles), tamanio)]
+        lotes = [[dato for subarbol in grupo for dato in subarbol._datos_preorder()] for grupo in grupos]
+        with ProcessPoolExecutor(max_workers=workers) as ejecutor:
+            parciales = list(ejecutor.map(_map_reduce_lote, lotes, [f] * len(lotes), [combinar] * len(lotes)))
+        return reduce(combinar, parciales, f(self.dato))
+
     def __eq__(self, otro: "ArbolN[T]") -> bool:
         pass
 
@@ -80,7 +405,8 @@ class ArbolN(Generic[T]):
         pass
 
     def nivel(self, x: T) -> int:
-        pass
+        encontrado = self._buscar(x)
+        return 0 if encontrado is None else encontrado[1]
     
     def copy(self) -> "ArbolN[T]":
         pass
@@ -89,7 +415,46 @@ class ArbolN(Generic[T]):
         pass
     
     def recorrido_guiado(self, direcciones: list[int]) -> T:
-        pass
+        actual = self
+        for direccion in direcciones:
+            actual = actual.subarboles[direccion]
+        return actual.dato
+
+
+def _map_reduce_lote(datos: list[T], f: Callable[[T], R], combinar: Callable[[R, R], R]) -> R:
+    return reduce(combinar, map(f, datos))
+
+
+def _trabajo_pesado(x: int) -> int:
+    # f costosa en CPU para medir map_reduce: el costo de enviar los datos queda chico frente al de calcular
+    total = 0
+    for i in range(2000):
+        total = (total * 31 + x + i) % 1000003
+    return total
+
+
+def comparar_map_reduce(ancho: int = 64, hijos: int = 50, max_workers: int = 8):
+    import time
+
+    # Bosque ancho: la raiz tiene `ancho` subarboles de `hijos` hojas cada uno
+    arbol = ArbolN(0)
+    for i in range(ancho):
+        subarbol = ArbolN(i)
+        for j in range(hijos):
+            subarbol.insertar_subarbol(ArbolN(i * hijos + j))
+        arbol.insertar_subarbol(subarbol)
+
+    print(f'map_reduce sobre {len(arbol)} nodos ({os.cpu_count()} nucleos disponibles):')
+    base = None
+    esperado = None
+    for workers in range(1, max_workers + 1):
+        inicio = time.perf_counter()
+        resultado = arbol.map_reduce(_trabajo_pesado, add, workers=workers)
+        tiempo = time.perf_counter() - inicio
+        base = tiempo if base is None else base
+        esperado = resultado if esperado is None else esperado
+        assert resultado == esperado
+        print(f'{workers} workers: {tiempo * 1000:8.1f}ms, aceleracion {base / tiempo:4.2f}x')
 
 
 def main():
@@ -121,10 +486,17 @@ def main():
     print(f'DFS preorder2: {t.preorder2()}')
     print(f'DFS preorder3: {t.preorder3()}')
     print(f'DFS posorder: {t.posorder()}')
+    print(f'Suma map_reduce: {t.map_reduce(abs, add, workers=2)}')
 
+    t.indexar()
+    print(f'Memoria del indice: {t.memoria_indice()} bytes')
     print(f'Nivel de 9: {t.nivel(9)}')
     print(f'Nivel de 13: {t.nivel(13)}')
 
+    ancestros = t.preprocesar_ancestros()
+    print(f'LCA de 9 y 8: {ancestros.lca(9, 8)}')
+    print(f'Distancia de 9 a 5: {ancestros.distancia(9, 5)}')
+
     t2 = t.copy()
     t3 = t2.sin_hojas()
     print(t)
@@ -134,6 +506,8 @@ def main():
 
     print(f'recorrido_guiado [2,0,0]: {t2.recorrido_guiado([2,0,0])}')
 
+    comparar_map_reduce()
+
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
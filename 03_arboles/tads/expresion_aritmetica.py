@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import TypeAlias
+from collections import deque
+from typing import Optional, TypeAlias
+import weakref
 from arbol_hojas import ArbolH
 
 Number: TypeAlias = int | float
@@ -47,6 +49,11 @@ class Division(Operador):
 class ExpresionAritmetica(ArbolH[Number,Operador]):
     def __init__(self, dato: Number):
         super().__init__(dato)
+        self._resultado: Optional[Number] = None
+        # Una subexpresion puede compartirse entre varias expresiones: al cambiar hay que invalidarlas a todas.
+        # Cada padre con la cantidad de veces que la usa como operando; las referencias son debiles para que
+        # las expresiones que ya no se usan no queden vivas (ni se recorran) a traves de sus operandos
+        self._padres: weakref.WeakKeyDictionary[ExpresionAritmetica, int] = weakref.WeakKeyDictionary()
 
     @staticmethod
     def valor(valor: Number) -> "ExpresionAritmetica":
@@ -75,15 +82,95 @@ class ExpresionAritmetica(ArbolH[Number,Operador]):
     def division(operando_1: "ExpresionAritmetica", operando_2: "ExpresionAritmetica") -> "ExpresionAritmetica":
         return ExpresionAritmetica._crear_operacion(Division(), operando_1, operando_2)
     
+    @property
+    def subarboles(self) -> "tuple[ExpresionAritmetica, ...]":
+        # Tupla: los operandos se cambian con reemplazar_operando, que invalida los resultados guardados
+        return tuple(self._subarboles)
+
+    def _insertar_subarbol_nocheck(self, subarbol: "ExpresionAritmetica") -> None:
+        super()._insertar_subarbol_nocheck(subarbol)
+        subarbol._padres[self] = subarbol._padres.get(self, 0) + 1
+        self._invalidar()
+
+    def reemplazar_operando(self, i: int, operando: "ExpresionAritmetica"):
+        if self.es_valor():
+            raise ValueError("Un valor no tiene operandos")
+        anterior = self._subarboles[i]
+        if anterior._padres[self] == 1:
+            del anterior._padres[self]
+        else:
+            anterior._padres[self] -= 1
+        operando._tipo_nodo = self._tipo_nodo
+        operando._padres[self] = operando._padres.get(self, 0) + 1
+        self._subarboles[i] = operando
+        self._invalidar()
+
+    def _invalidar(self):
+        # Invariante: si una expresion no tiene su resultado guardado, tampoco lo tiene ninguna que la contenga.
+        # Se sube por todos los padres cortando en los que ya estaban invalidados
+        self._resultado = None
+        pendientes = list(self._padres)
+        while pendientes:
+            ancestro = pendientes.pop()
+            if ancestro._resultado is not None:
+                ancestro._resultado = None
+                pendientes.extend(ancestro._padres)
+
+    def _contiene(self, subexpresion: "ExpresionAritmetica") -> bool:
+        vistos: set[int] = set()
+        pendientes = deque([subexpresion])
+        while pendientes:
+            actual = pendientes.popleft()
+            if actual is self:
+                return True
+            if id(actual) not in vistos:
+                vistos.add(id(actual))
+                pendientes.extend(actual._padres)
+        return False
+
     def es_valor(self) -> bool:
         return self.es_hoja()
     
+    def es_valido(self) -> bool:
+        # Los operadores son de clases distintas, asi que no alcanza con que todos los nodos sean del mismo tipo:
+        # cada nodo intermedio es un Operador con dos operandos y cada hoja es un numero
+        pila: list[ArbolH[Number, Operador]] = [self]
+        while pila:
+            t = pila.pop()
+            if t.es_hoja():
+                if not isinstance(t._dato, (int, float)):
+                    return False
+            elif not isinstance(t._dato, Operador) or len(t.subarboles) != 2:
+                return False
+            else:
+                pila.extend(t.subarboles)
+        return True
+
     def evaluar(self) -> Number:
         if self.es_valor():
             return self.dato_hoja()
-        operador = self.dato_nodo()
-        operando_1, operando_2 = self.subarboles
-        return operador.operar(operando_1.evaluar(), operando_2.evaluar())
+        if self._resultado is None:
+            operador = self.dato_nodo()
+            operando_1, operando_2 = self.subarboles
+            self._resultado = operador.operar(operando_1.evaluar(), operando_2.evaluar())
+        return self._resultado
+
+    def actualizar_valor(self, hoja: "ExpresionAritmetica", nuevo: Number) -> Number:
+        return self.actualizar_valores([(hoja, nuevo)])
+
+    def actualizar_valores(self, cambios: "list[tuple[ExpresionAritmetica, Number]]") -> Number:
+        # Se invalida el camino de cada hoja hasta la raiz (cortando en el primer ancestro ya invalidado,
+        # asi los ancestros comunes se recalculan una sola vez) y se vuelve a evaluar: solo se recalculan
+        # los nodos invalidados, el resto usa su resultado guardado
+        for hoja, nuevo in cambios:
+            if not hoja.es_valor():
+                raise ValueError("Solo se pueden actualizar los valores de las hojas")
+            if not self._contiene(hoja):
+                raise ValueError("La hoja no pertenece a la expresion")
+        for hoja, nuevo in cambios:
+            hoja._dato = nuevo
+            hoja._invalidar()
+        return self.evaluar()
     
     def __str__(self) -> str:
         return super().__str__()
@@ -113,5 +200,9 @@ def main():
     print(expresion)
     print(f'El resultado es: {expresion.evaluar()}')
 
+    # Cambia el 9 por 12: solo se recalcula el camino desde esa hoja hasta la raiz
+    nueve = expresion.subarboles[0].subarboles[1].subarboles[0]
+    print(f'Con 12 en lugar de 9: {expresion.actualizar_valor(nueve, 12)}')
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,57 @@
+import random
+import pytest
+from ..arbol_b import ArbolB
+
+
+@pytest.fixture
+def claves():
+    generador = random.Random(7)
+    return [generador.randrange(-1000, 1000) for _ in range(3000)]
+
+
+def test_insertar_e_iterar(tmp_path, claves):
+    with ArbolB(str(tmp_path / 'arbol'), grado=3, paginas_en_cache=4) as arbol:
+        for clave in claves:
+            arbol.insertar(clave)
+        assert len(arbol) == len(claves)
+        assert list(arbol) == sorted(claves)
+
+def test_pertenece(tmp_path, claves):
+    with ArbolB(str(tmp_path / 'arbol'), grado=4) as arbol:
+        for clave in claves:
+            arbol.insertar(clave)
+        assert all(arbol.pertenece(clave) for clave in claves)
+        assert not arbol.pertenece(5000)
+
+def test_rango(tmp_path, claves):
+    with ArbolB(str(tmp_path / 'arbol'), grado=3, paginas_en_cache=3) as arbol:
+        for clave in claves:
+            arbol.insertar(clave)
+        assert list(arbol.rango(-50, 75)) == [clave for clave in sorted(claves) if -50 <= clave < 75]
+
+def test_persistencia(tmp_path, claves):
+    ruta = str(tmp_path / 'arbol')
+    with ArbolB(ruta, grado=5) as arbol:
+        for clave in claves:
+            arbol.insertar(clave)
+    with ArbolB(ruta, grado=5) as arbol:
+        assert list(arbol) == sorted(claves)
+
+def test_grado_distinto(tmp_path):
+    ruta = str(tmp_path / 'arbol')
+    ArbolB(ruta, grado=5).cerrar()
+    with pytest.raises(ValueError):
+        ArbolB(ruta, grado=6)
+
+
+def test_insertar_clave_invalida(tmp_path):
+    with ArbolB(str(tmp_path / 'arbol'), grado=2, paginas_en_cache=3) as arbol:
+        arbol.insertar(2 ** 63 - 1)
+        arbol.insertar(-2 ** 63)
+        with pytest.raises(ValueError):
+            arbol.insertar(2 ** 70)
+        with pytest.raises(TypeError):
+            arbol.insertar(1.5)
+        assert len(arbol) == 2
+    with ArbolB(str(tmp_path / 'arbol'), grado=2, paginas_en_cache=3) as arbol:
+        assert list(arbol) == [-2 ** 63, 2 ** 63 - 1]
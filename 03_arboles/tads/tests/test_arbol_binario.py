@@ -1,3 +1,6 @@
+import io
+import copy
+import pickle
 import pytest
 from ..arbol_binario import ArbolBinario
 
@@ -14,10 +17,7 @@ def arbol_un_nodo():
 
 @pytest.fixture
 def arbol_tres_nodos():
-    tree = ArbolBinario.crear_nodo(1)
-    tree.raiz.si = ArbolBinario.crear_nodo(2)
-    tree.raiz.sd = ArbolBinario.crear_nodo(3)
-    return tree
+    return ArbolBinario.crear_nodo(1, ArbolBinario.crear_nodo(2), ArbolBinario.crear_nodo(3))
 
 
 def test_es_vacio(arbol_vacio):
@@ -77,4 +77,176 @@ def test_espejo(arbol_tres_nodos):
 
 def test_sin_hojas(arbol_tres_nodos):
     arbol_tres_nodos.sin_hojas()
-    assert arbol_tres_nodos.inorder() == [1]
\ No newline at end of file
+    assert arbol_tres_nodos.inorder() == [1]
+
+def test_nivel(arbol_tres_nodos):
+    assert arbol_tres_nodos.nivel(1) == 1
+    assert arbol_tres_nodos.nivel(3) == 2
+    assert arbol_tres_nodos.nivel(9) == 0
+
+def test_indice_incremental(arbol_tres_nodos):
+    arbol_tres_nodos.indexar()
+    arbol_tres_nodos.sd().insertar_si(ArbolBinario.crear_nodo(4))
+    assert arbol_tres_nodos.nivel(4) == 3
+    assert arbol_tres_nodos.camino(4) == [1, 0]
+    assert arbol_tres_nodos.pertenece(4)
+    assert arbol_tres_nodos.memoria_indice() > 0
+
+def test_indice_reemplazo(arbol_tres_nodos):
+    arbol_tres_nodos.indexar()
+    arbol_tres_nodos.insertar_si(ArbolBinario.crear_nodo(5))
+    assert not arbol_tres_nodos.pertenece(2)
+    assert arbol_tres_nodos.nivel(5) == 2
+
+def test_indice_subarbol_separado(arbol_tres_nodos):
+    arbol_tres_nodos.indexar()
+    separado = arbol_tres_nodos.si()
+    arbol_tres_nodos.insertar_si(ArbolBinario.crear_nodo(5))
+    assert arbol_tres_nodos.nivel(5) == 2
+    separado.insertar_si(ArbolBinario.crear_nodo(99))
+    assert not arbol_tres_nodos.pertenece(99)
+    assert arbol_tres_nodos.camino(99) is None
+
+def test_indexar_subarbol_de_arbol_indexado(arbol_tres_nodos):
+    arbol_tres_nodos.indexar()
+    with pytest.raises(ValueError):
+        arbol_tres_nodos.si().indexar()
+    arbol_tres_nodos.si().insertar_si(ArbolBinario.crear_nodo(7))
+    arbol_tres_nodos.si().si().insertar_si(ArbolBinario.crear_nodo(77))
+    assert arbol_tres_nodos.nivel(77) == 4
+
+def test_copy_no_modifica_original(arbol_tres_nodos):
+    copy = arbol_tres_nodos.copy()
+    copy.si().insertar_si(ArbolBinario.crear_nodo(4))
+    arbol_tres_nodos.insertar_sd(ArbolBinario.crear_nodo(5))
+    assert copy.inorder() == [4, 2, 1, 3]
+    assert arbol_tres_nodos.inorder() == [2, 1, 5]
+
+def test_espejo_no_modifica_original(arbol_tres_nodos):
+    espejo = arbol_tres_nodos.espejo()
+    espejo.si().insertar_sd(ArbolBinario.crear_nodo(4))
+    assert espejo.inorder() == [3, 4, 1, 2]
+    assert arbol_tres_nodos.inorder() == [2, 1, 3]
+    assert espejo.espejo().inorder() == [2, 1, 4, 3]
+
+def test_copy_aislada_de_subarboles_previos():
+    t = ArbolBinario.crear_nodo(1)
+    n2 = ArbolBinario.crear_nodo(2)
+    n5 = ArbolBinario.crear_nodo(5)
+    n2.insertar_sd(n5)
+    t.insertar_si(n2)
+    copia = t.copy()
+    espejo = t.espejo()
+    n5.insertar_sd(ArbolBinario.crear_nodo(9))
+    n2.insertar_si(ArbolBinario.crear_nodo(7))
+    assert copia.inorder() == [2, 5, 1]
+    assert espejo.inorder() == [1, 5, 2]
+    assert t.inorder() == [7, 2, 5, 9, 1]
+    assert len(copia) == len(espejo) == 3
+    assert len(t) == 5
+    assert t.si() is t.si()
+
+def test_copy_de_copia_aislada():
+    t = ArbolBinario.crear_nodo(1, ArbolBinario.crear_nodo(2), ArbolBinario.crear_nodo(3))
+    copia = t.copy()
+    izquierdo = copia.si()
+    segunda = copia.copy()
+    izquierdo.insertar_si(ArbolBinario.crear_nodo(4))
+    t.sd().insertar_sd(ArbolBinario.crear_nodo(6))
+    assert copia.inorder() == [4, 2, 1, 3]
+    assert segunda.inorder() == [2, 1, 3]
+    assert t.inorder() == [2, 1, 3, 6]
+
+def test_len_altura_de_copia_modificada():
+    for copiar in (ArbolBinario.copy, ArbolBinario.espejo):
+        t = ArbolBinario.crear_nodo(0, None, ArbolBinario.crear_nodo(1, None, ArbolBinario.crear_nodo(2)))
+        assert len(t) == t.altura() == 3
+        copia = copiar(t)
+        assert len(copia) == copia.altura() == 3
+        hoja = copia.sd().sd() if copiar is ArbolBinario.copy else copia.si().si()
+        hoja.insertar_si(ArbolBinario.crear_nodo(9))
+        assert len(copia) == copia.altura() == 4
+        assert len(list(iter(copia))) == 4
+        copia.sin_hojas()
+        assert len(copia) == copia.altura() == 3
+        assert len(t) == t.altura() == 3
+
+def test_materializar(arbol_tres_nodos):
+    materializado = arbol_tres_nodos.espejo().materializar()
+    assert materializado.inorder() == [3, 1, 2]
+    assert materializado.raiz is not arbol_tres_nodos.raiz
+
+def test_len_altura_cacheados(arbol_un_nodo):
+    assert len(arbol_un_nodo) == 1
+    hijo = ArbolBinario.crear_nodo(2)
+    arbol_un_nodo.insertar_si(hijo)
+    assert len(arbol_un_nodo) == 2
+    hijo.insertar_sd(ArbolBinario.crear_nodo(3))
+    assert len(arbol_un_nodo) == 3
+    assert arbol_un_nodo.altura() == 3
+    arbol_un_nodo.sin_hojas()
+    assert len(arbol_un_nodo) == 2
+    assert arbol_un_nodo.altura() == 2
+
+def test_len_tras_modificar_subarbol(arbol_tres_nodos):
+    assert len(arbol_tres_nodos) == 3
+    arbol_tres_nodos.si().insertar_si(ArbolBinario.crear_nodo(4))
+    assert len(arbol_tres_nodos) == len(arbol_tres_nodos.inorder()) == 4
+    assert arbol_tres_nodos.altura() == 3
+
+def test_subarbol_compartido():
+    s = ArbolBinario.crear_nodo(5)
+    t1 = ArbolBinario.crear_nodo(1, s)
+    assert len(t1) == 2
+    with pytest.raises(ValueError):
+        ArbolBinario.crear_nodo(2, None, s)
+    with pytest.raises(ValueError):
+        t1.insertar_sd(s)
+    with pytest.raises(ValueError):
+        ArbolBinario.crear_nodo(3, t1.copy().si())
+    s.insertar_si(ArbolBinario.crear_nodo(6))
+    assert len(t1) == 3
+    t1.insertar_si(ArbolBinario())
+    ArbolBinario.crear_nodo(2, None, s)
+
+def test_escribir_truncado(arbol_tres_nodos):
+    destino = io.StringIO()
+    arbol_tres_nodos.escribir(destino, max_nivel=1)
+    assert destino.getvalue() == '1\n....<truncado>\n'
+
+def test_escribir_max_nodos(arbol_tres_nodos):
+    destino = io.StringIO()
+    arbol_tres_nodos.escribir(destino, max_nodos=2)
+    assert destino.getvalue() == '1\n....2\n........AV\n........AV\n....<truncado>\n'
+
+def test_str_arbol_profundo():
+    arbol = ArbolBinario.crear_nodo(0)
+    actual = arbol
+    for i in range(1, 5000):
+        nuevo = ArbolBinario.crear_nodo(i)
+        actual.insertar_si(nuevo)
+        actual = nuevo
+    assert str(arbol).count('\n') == 5000 * 2 + 1
+
+def test_pickle_arbol_profundo():
+    arbol = ArbolBinario.crear_nodo(0)
+    for i in range(1, 50000):
+        arbol = ArbolBinario.crear_nodo(i, None, arbol)
+    copia = pickle.loads(pickle.dumps(arbol))
+    assert list(iter(copia)) == list(iter(arbol))
+
+def test_len_altura_arbol_profundo():
+    arbol = ArbolBinario.crear_nodo(0)
+    for i in range(1, 50000):
+        arbol = ArbolBinario.crear_nodo(i, None, arbol)
+    assert len(arbol) == arbol.altura() == 50000
+    assert list(arbol) == list(range(49999, -1, -1))
+    assert arbol.espejo().altura() == 50000
+
+def test_deepcopy_independiente(arbol_tres_nodos):
+    espejo = arbol_tres_nodos.espejo()
+    copia = copy.deepcopy(espejo)
+    assert str(copia) == str(espejo)
+    copia.si().insertar_si(ArbolBinario.crear_nodo(4))
+    assert str(copia) != str(espejo)
+    assert len(espejo) == 3
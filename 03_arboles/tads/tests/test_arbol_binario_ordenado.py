@@ -0,0 +1,215 @@
+import copy
+import os
+import pickle
+import random
+import sys
+import threading
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from arbol_binario import ArbolBinario
+from arbol_binario_ordenado import ArbolBinarioOrdenado
+
+
+@pytest.fixture
+def arbol_ordenado():
+    tree = ArbolBinarioOrdenado()
+    for valor in [10, 5, 15, 2, 7, 12, 17]:
+        tree.insertar(valor)
+    return tree
+
+
+def test_iter(arbol_ordenado):
+    assert list(arbol_ordenado) == [2, 5, 7, 10, 12, 15, 17]
+
+def test_snapshot_no_ve_inserciones(arbol_ordenado):
+    snapshot = arbol_ordenado.snapshot()
+    arbol_ordenado.insertar(8)
+    arbol_ordenado.insertar(1)
+    assert list(snapshot) == [2, 5, 7, 10, 12, 15, 17]
+    assert list(arbol_ordenado) == [1, 2, 5, 7, 8, 10, 12, 15, 17]
+
+def test_snapshot_concurrente():
+    tree: ArbolBinarioOrdenado[int] = ArbolBinarioOrdenado()
+    tree.habilitar_concurrencia()
+    terminado = threading.Event()
+    errores: list[str] = []
+
+    def escritor():
+        generador = random.Random(1)
+        for _ in range(2000):
+            tree.insertar(generador.randrange(10 ** 6))
+        terminado.set()
+
+    def lector():
+        while not terminado.is_set():
+            snapshot = tree.snapshot()
+            recorrido = list(snapshot)
+            if recorrido != sorted(recorrido) or list(snapshot) != recorrido or len(snapshot) != len(recorrido):
+                errores.append('snapshot inconsistente')
+
+    hilos = [threading.Thread(target=escritor)] + [threading.Thread(target=lector) for _ in range(8)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    assert not errores
+    assert len(tree) == 2000
+    assert list(tree) == sorted(tree)
+
+def test_pertenece(arbol_ordenado):
+    assert arbol_ordenado.pertenece(12)
+    assert not arbol_ordenado.pertenece(11)
+
+def test_rango(arbol_ordenado):
+    assert list(arbol_ordenado.rango(5, 15)) == [5, 7, 10, 12]
+    assert list(arbol_ordenado.rango(18, 30)) == []
+
+@pytest.fixture
+def otro_ordenado():
+    tree = ArbolBinarioOrdenado()
+    for valor in [7, 3, 12, 20, 1]:
+        tree.insertar(valor)
+    return tree
+
+@pytest.mark.parametrize('dividir', [False, True])
+def test_operaciones_de_conjuntos(arbol_ordenado, otro_ordenado, dividir):
+    union = arbol_ordenado.union(otro_ordenado, dividir)
+    assert list(union) == [1, 2, 3, 5, 7, 10, 12, 15, 17, 20]
+    assert union.es_ordenado()
+    assert list(arbol_ordenado.interseccion(otro_ordenado, dividir)) == [7, 12]
+    assert list(arbol_ordenado.diferencia(otro_ordenado, dividir)) == [2, 5, 10, 15, 17]
+    assert list(arbol_ordenado) == [2, 5, 7, 10, 12, 15, 17]
+
+def test_union_balanceada(arbol_ordenado, otro_ordenado):
+    assert arbol_ordenado.union(otro_ordenado).altura() == 4
+
+def test_operar_dividiendo_degenerado():
+    tree: ArbolBinarioOrdenado[int] = ArbolBinarioOrdenado()
+    for valor in range(2000):
+        tree.insertar(valor)
+    otro: ArbolBinarioOrdenado[int] = ArbolBinarioOrdenado()
+    for valor in [1999, 3000, 500]:
+        otro.insertar(valor)
+    assert list(iter(tree.union(otro, dividir=True)))[-2:] == [1999, 3000]
+    assert list(iter(tree.interseccion(otro, dividir=True))) == [500, 1999]
+    assert len(list(iter(tree.diferencia(otro, dividir=True)))) == 1998
+
+def test_union_dividiendo_encadenada():
+    tree: ArbolBinarioOrdenado[int] = ArbolBinarioOrdenado()
+    for valor in range(300):
+        unitario: ArbolBinarioOrdenado[int] = ArbolBinarioOrdenado()
+        unitario.insertar(valor)
+        tree = tree.union(unitario, dividir=True)
+    assert list(iter(tree)) == list(range(300))
+    tree.rebalancear()
+    assert tree.altura() == 9
+    assert list(iter(tree)) == list(range(300))
+
+def test_fusionar(arbol_ordenado, otro_ordenado):
+    fusion = arbol_ordenado.fusionar(otro_ordenado)
+    assert fusion == [1, 2, 3, 5, 7, 7, 10, 12, 12, 15, 17, 20]
+    assert arbol_ordenado.es_ordenado() and otro_ordenado.es_ordenado()
+    assert arbol_ordenado.union(otro_ordenado).es_ordenado()
+
+def test_convertir_ordenado():
+    tree = ArbolBinario.crear_nodo(4)
+    actual = tree
+    for valor in [9, 1, 7, 3, 8]:
+        nuevo = ArbolBinario.crear_nodo(valor)
+        actual.insertar_si(nuevo)
+        actual = nuevo
+    ordenado = ArbolBinarioOrdenado.convertir_ordenado(tree)
+    assert list(ordenado) == [1, 3, 4, 7, 8, 9]
+    assert ordenado.es_ordenado()
+    assert ordenado.altura() == 3
+
+def test_rebalancear_exclusion_escritura(arbol_ordenado):
+    arbol_ordenado.habilitar_concurrencia()
+    with arbol_ordenado._escritura:
+        hilo = threading.Thread(target=arbol_ordenado.rebalancear)
+        hilo.start()
+        hilo.join(0.1)
+        assert hilo.is_alive()
+    hilo.join()
+    assert list(arbol_ordenado) == [2, 5, 7, 10, 12, 15, 17]
+
+def test_insertar_ordenados_profundo():
+    tree: ArbolBinarioOrdenado[int] = ArbolBinarioOrdenado()
+    tree.habilitar_concurrencia()
+    for valor in range(3000):
+        tree.insertar(valor)
+    assert tree.pertenece(2999)
+    assert list(iter(tree)) == list(range(3000))
+
+def test_convertir_ordenado_repetidos():
+    tree = ArbolBinario.crear_nodo(3, ArbolBinario.crear_nodo(3), ArbolBinario.crear_nodo(3))
+    ordenado = ArbolBinarioOrdenado.convertir_ordenado(tree)
+    assert ordenado.es_ordenado()
+    assert list(ordenado) == [3]
+
+def test_rebalancear_degenerado():
+    tree: ArbolBinarioOrdenado[int] = ArbolBinarioOrdenado()
+    for valor in range(100):
+        tree.insertar(valor)
+    assert tree.altura() == 100
+    tree.rebalancear()
+    assert list(tree) == list(range(100))
+    assert tree.altura() == 7
+    assert len(tree) == 100
+
+def test_rebalancear_no_modifica_copias(arbol_ordenado):
+    copia = arbol_ordenado.copy()
+    arbol_ordenado.insertar(20)
+    arbol_ordenado.insertar(25)
+    arbol_ordenado.rebalancear()
+    assert list(copia) == [2, 5, 7, 10, 12, 15, 17]
+    assert arbol_ordenado.altura() == 4
+
+def test_pertenece_muchos(arbol_ordenado):
+    claves = [12, 3, 17, 2, 12, 100, -1] * 10
+    assert list(arbol_ordenado.pertenece_muchos(claves)) == [arbol_ordenado.pertenece(clave) for clave in claves]
+
+def test_pertenece_muchos_pocas_claves(arbol_ordenado):
+    assert list(arbol_ordenado.pertenece_muchos([7])) == [True]
+    assert list(arbol_ordenado.pertenece_muchos([])) == []
+
+def test_pertenece_muchos_ndarray(arbol_ordenado):
+    assert list(arbol_ordenado.pertenece_muchos(np.array([1, 2, 8]))) == [False, True, False]
+    claves = np.array([12, 3, 17, 2, 12, 100, -1] * 10)
+    assert list(arbol_ordenado.pertenece_muchos(claves)) == [arbol_ordenado.pertenece(clave) for clave in claves]
+    assert list(arbol_ordenado.pertenece_muchos(np.array([], dtype=int))) == []
+
+def test_pertenece_muchos_degenerado():
+    tree = ArbolBinarioOrdenado.crear_nodo(0)
+    actual = tree
+    for valor in range(1, 3000):
+        nuevo = ArbolBinarioOrdenado.crear_nodo(valor)
+        ArbolBinario.insertar_sd(actual, nuevo)
+        actual = nuevo
+    claves = [2999, -1, 1500, 3000]
+    assert list(tree.pertenece_muchos(claves)) == [True, False, True, False]
+    assert list(tree.pertenece_muchos(np.arange(-5, 3005))) == [0 <= i < 3000 for i in range(-5, 3005)]
+    assert len(list(tree)) == len(tree) == tree.altura() == 3000
+
+def test_pertenece_muchos_tuplas():
+    tree = ArbolBinarioOrdenado._desde_ordenados([(0, 1), (1, 0), (2, 2)])
+    claves = [(2, 2), (0, 0), (1, 0)] * 5
+    assert list(tree.pertenece_muchos(claves)) == [True, False, True] * 5
+
+def test_pickle(arbol_ordenado):
+    copia = pickle.loads(pickle.dumps(arbol_ordenado))
+    assert isinstance(copia, ArbolBinarioOrdenado)
+    assert list(copia) == list(arbol_ordenado)
+    copia.insertar(11)
+    assert copia.pertenece(11) and not arbol_ordenado.pertenece(11)
+
+def test_pickle_conserva_concurrencia(arbol_ordenado):
+    assert pickle.loads(pickle.dumps(arbol_ordenado))._escritura is None
+    arbol_ordenado.habilitar_concurrencia()
+    for copia in (pickle.loads(pickle.dumps(arbol_ordenado)), copy.deepcopy(arbol_ordenado)):
+        assert copia._escritura is not None and copia._escritura is not arbol_ordenado._escritura
+        assert list(copia) == list(arbol_ordenado)
+        copia.insertar(11)
+        assert list(copia) == [2, 5, 7, 10, 11, 12, 15, 17]
@@ -0,0 +1,67 @@
+import io
+import pickle
+import pytest
+from ..arbol_hojas import ArbolH
+
+
+@pytest.fixture
+def arbol():
+    nodo_b = ArbolH.crear_nodo_y_hojas('b', 6, 7)
+    arbol = ArbolH.crear_nodo_y_hojas('a', 1, 2, 3)
+    arbol.insertar_subarbol(nodo_b)
+    return arbol
+
+
+def test_es_valido(arbol):
+    assert arbol.es_valido()
+    assert ArbolH(1).es_valido()
+
+def test_es_valido_tipos_mezclados(arbol):
+    arbol.subarboles[0]._dato = 'uno'
+    assert not arbol.es_valido()
+    arbol.subarboles[0]._dato = 1
+    arbol.subarboles[-1]._dato = 2
+    assert not arbol.es_valido()
+
+def test_es_valido_profundo():
+    arbol = ArbolH.crear_nodo_y_hojas('n', 0)
+    actual = arbol
+    for i in range(5000):
+        nuevo = ArbolH.crear_nodo_y_hojas('n', i)
+        actual.insertar_subarbol(nuevo)
+        actual = nuevo
+    assert arbol.es_valido()
+
+def test_compacto_igual_que_nodos():
+    normal = ArbolH.crear_nodo_y_hojas('a', 1, 2, 3)
+    compacto = ArbolH.crear_nodo_y_hojas('a', 1, 2, 3, compacto=True)
+    assert compacto.es_compacto()
+    assert list(compacto.hojas()) == list(normal.hojas()) == [1, 2, 3]
+    assert str(compacto) == str(normal)
+    assert compacto.es_valido()
+    assert not compacto.es_hoja()
+
+def test_compacto_sin_tipo_numerico():
+    assert not ArbolH.crear_nodo_y_hojas('a', 'x', 'y', compacto=True).es_compacto()
+    assert not ArbolH.crear_nodo_y_hojas('a', 2 ** 70, 1, compacto=True).es_compacto()
+
+def test_compacto_insertar_descompacta(arbol):
+    compacto = ArbolH.crear_nodo_y_hojas('c', 8.5, 9.5, compacto=True)
+    arbol.insertar_subarbol(ArbolH.crear_nodo_y_hojas('c', 8, 9, compacto=True))
+    compacto.insertar_subarbol(ArbolH(10.5))
+    assert not compacto.es_compacto()
+    assert [t.dato_hoja() for t in compacto.subarboles] == [8.5, 9.5, 10.5]
+    assert list(arbol.hojas()) == [1, 2, 3, 6, 7, 8, 9]
+    assert arbol.es_valido()
+
+def test_escribir_compacto_truncado():
+    destino = io.StringIO()
+    ArbolH.crear_nodo_y_hojas('a', 1, 2, 3, compacto=True).escribir(destino, max_nodos=2)
+    assert destino.getvalue() == ' a \n.... [1] \n.... <truncado> \n'
+
+def test_pickle_conserva_compactos(arbol):
+    arbol.insertar_subarbol(ArbolH.crear_nodo_y_hojas('c', 8, 9, compacto=True))
+    copia = pickle.loads(pickle.dumps(arbol))
+    assert str(copia) == str(arbol)
+    assert copia.subarboles[-1].es_compacto()
+    assert copia.es_valido()
@@ -0,0 +1,126 @@
+import io
+import pytest
+import copy
+import pickle
+from operator import add
+from ..arbol_nario import ArbolN
+
+
+@pytest.fixture
+def arbol_ancho():
+    tree = ArbolN(1)
+    for i in range(2, 6):
+        subarbol = ArbolN(i)
+        subarbol.insertar_subarbol(ArbolN(i * 10))
+        tree.insertar_subarbol(subarbol)
+    return tree
+
+
+def test_map_reduce_secuencial(arbol_ancho):
+    assert arbol_ancho.map_reduce(abs, add, workers=1) == sum(arbol_ancho.preorder())
+
+def test_map_reduce_paralelo(arbol_ancho):
+    assert arbol_ancho.map_reduce(abs, add, workers=2) == sum(arbol_ancho.preorder())
+
+def test_map_reduce_respeta_orden(arbol_ancho):
+    assert arbol_ancho.map_reduce(str, add, workers=3) == ''.join(map(str, arbol_ancho.preorder()))
+
+def test_nivel(arbol_ancho):
+    assert arbol_ancho.nivel(1) == 1
+    assert arbol_ancho.nivel(30) == 3
+    assert arbol_ancho.nivel(99) == 0
+
+def test_indice_incremental(arbol_ancho):
+    arbol_ancho.indexar()
+    arbol_ancho.subarboles[1].subarboles[0].insertar_subarbol(ArbolN(7))
+    assert arbol_ancho.nivel(7) == 4
+    assert arbol_ancho.camino(7) == [1, 0, 0]
+    assert arbol_ancho.recorrido_guiado(arbol_ancho.camino(7)) == 7
+    assert arbol_ancho.pertenece(7)
+
+def test_indice_cambio_de_dato(arbol_ancho):
+    arbol_ancho.indexar()
+    assert arbol_ancho.pertenece(2)
+    arbol_ancho.subarboles[0].dato = 99
+    assert arbol_ancho.pertenece(99)
+    assert not arbol_ancho.pertenece(2)
+
+def test_indice_subarbol_separado(arbol_ancho):
+    arbol_ancho.indexar()
+    separado = arbol_ancho.subarboles[0]
+    arbol_ancho.subarboles = arbol_ancho.subarboles[1:]
+    assert arbol_ancho.nivel(2) == 0
+    separado.insertar_subarbol(ArbolN(99))
+    assert not arbol_ancho.pertenece(99)
+
+def test_indexar_subarbol_de_arbol_indexado(arbol_ancho):
+    arbol_ancho.indexar()
+    with pytest.raises(ValueError):
+        arbol_ancho.subarboles[0].indexar()
+    arbol_ancho.subarboles[0].insertar_subarbol(ArbolN(77))
+    assert arbol_ancho.nivel(77) == 3
+
+def test_ancestros(arbol_ancho):
+    arbol_ancho.subarboles[0].insertar_subarbol(ArbolN(21))
+    ancestros = arbol_ancho.preprocesar_ancestros()
+    assert ancestros.lca(20, 21) == 2
+    assert ancestros.lca(20, 50) == 1
+    assert ancestros.lca(3, 30) == 3
+    assert ancestros.distancia(20, 50) == 4
+    assert ancestros.es_ancestro(2, 21)
+    assert not ancestros.es_ancestro(21, 2)
+
+def test_ancestros_muchos(arbol_ancho):
+    ancestros = arbol_ancho.preprocesar_ancestros()
+    pares = [(20, 30), (4, 40), (1, 5)]
+    assert list(ancestros.lca_muchos(pares)) == [1, 4, 1]
+    assert list(ancestros.es_ancestro_muchos(pares)) == [False, True, True]
+
+def test_len_altura_cacheados(arbol_ancho):
+    assert len(arbol_ancho) == 9
+    assert arbol_ancho.altura() == 3
+    arbol_ancho.subarboles[2].subarboles[0].insertar_subarbol(ArbolN(8))
+    assert len(arbol_ancho) == 10
+    assert arbol_ancho.altura() == 4
+    arbol_ancho.subarboles = arbol_ancho.subarboles[:1]
+    assert len(arbol_ancho) == 3
+    assert arbol_ancho.altura() == 3
+
+def test_subarboles_no_se_modifican_por_fuera(arbol_ancho):
+    assert len(arbol_ancho) == 9
+    with pytest.raises(AttributeError):
+        arbol_ancho.subarboles.append(ArbolN(3))
+    assert len(arbol_ancho) == 9
+
+def test_subarbol_compartido(arbol_ancho):
+    hijo = arbol_ancho.subarboles[0]
+    with pytest.raises(ValueError):
+        ArbolN(0).insertar_subarbol(hijo)
+    with pytest.raises(ValueError):
+        arbol_ancho.subarboles = [hijo, hijo]
+    arbol_ancho.subarboles = arbol_ancho.subarboles[1:]
+    ArbolN(0).insertar_subarbol(hijo)
+
+def test_escribir_truncado_acotado():
+    arbol = ArbolN(0)
+    for i in range(1, 1001):
+        arbol.insertar_subarbol(ArbolN(i))
+    destino = io.StringIO()
+    arbol.escribir(destino, max_nodos=5)
+    assert destino.getvalue() == '0\n....1\n....2\n....3\n....4\n....<truncado>\n'
+    destino = io.StringIO()
+    arbol.escribir(destino, max_nivel=1)
+    assert destino.getvalue() == '0\n....<truncado>\n'
+
+def test_pickle_y_deepcopy(arbol_ancho):
+    for copia in [pickle.loads(pickle.dumps(arbol_ancho)), copy.deepcopy(arbol_ancho)]:
+        assert copia._datos_preorder() == arbol_ancho._datos_preorder()
+        assert [len(subarbol.subarboles) for subarbol in copia.subarboles] == [1, 1, 1, 1]
+        assert copia.subarboles[0]._padre is copia
+
+def test_ancestros_muchos_datos_tupla():
+    arbol = ArbolN((0, 0))
+    arbol.insertar_subarbol(ArbolN((1, 0)))
+    arbol.insertar_subarbol(ArbolN((1, 1)))
+    ancestros = arbol.preprocesar_ancestros()
+    assert list(ancestros.lca_muchos([((1, 0), (1, 1))])) == [(0, 0)]
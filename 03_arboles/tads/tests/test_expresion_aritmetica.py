@@ -0,0 +1,79 @@
+import gc
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from expresion_aritmetica import ExpresionAritmetica, Suma
+
+
+@pytest.fixture
+def hojas():
+    return [ExpresionAritmetica.valor(valor) for valor in [2, 9, 2, 1]]
+
+
+@pytest.fixture
+def expresion(hojas):
+    # 2 * 9 - (2 + 1)
+    return ExpresionAritmetica.resta(
+        ExpresionAritmetica.producto(hojas[0], hojas[1]),
+        ExpresionAritmetica.suma(hojas[2], hojas[3])
+    )
+
+
+def test_evaluar(expresion):
+    assert expresion.evaluar() == 15
+
+def test_actualizar_valor(expresion, hojas):
+    expresion.evaluar()
+    assert expresion.actualizar_valor(hojas[1], 10) == 17
+    assert expresion.evaluar() == 17
+
+def test_actualizar_valores(expresion, hojas):
+    expresion.evaluar()
+    assert expresion.actualizar_valores([(hojas[0], 3), (hojas[3], 5)]) == 20
+
+def test_actualizar_valor_no_hoja(expresion):
+    with pytest.raises(ValueError):
+        expresion.actualizar_valor(expresion, 1)
+
+def test_es_valido(expresion):
+    assert expresion.es_valido()
+    expresion.subarboles[0].reemplazar_operando(1, ExpresionAritmetica(Suma()))
+    assert not expresion.es_valido()
+
+def test_subexpresion_compartida():
+    x, y, z = ExpresionAritmetica.valor(2), ExpresionAritmetica.valor(3), ExpresionAritmetica.valor(10)
+    e = ExpresionAritmetica.suma(x, y)
+    f = ExpresionAritmetica.producto(e, z)
+    assert f.evaluar() == 50
+    g = ExpresionAritmetica.resta(e, ExpresionAritmetica.valor(0))
+    assert g.actualizar_valor(x, 5) == 8
+    assert f.evaluar() == 80
+
+def test_reemplazar_operando(expresion):
+    resultado = expresion.evaluar()
+    operacion = expresion.subarboles[1]
+    with pytest.raises(TypeError):
+        operacion.subarboles[0] = ExpresionAritmetica.valor(50)
+    anterior = operacion.subarboles[0]
+    operacion.reemplazar_operando(0, ExpresionAritmetica.valor(anterior.dato_hoja() + 1))
+    assert expresion.evaluar() == resultado - 1
+    assert expresion.es_valido()
+
+def test_actualizar_valor_hoja_ajena(expresion):
+    expresion.evaluar()
+    with pytest.raises(ValueError):
+        expresion.actualizar_valor(ExpresionAritmetica.valor(1), 5)
+
+def test_padres_temporales_liberados():
+    x = ExpresionAritmetica.valor(2)
+    e = ExpresionAritmetica.suma(x, x)
+    for i in range(10000):
+        ExpresionAritmetica.producto(x, ExpresionAritmetica.valor(i)).evaluar()
+    gc.collect()
+    assert list(x._padres.items()) == [(e, 2)]
+    e.reemplazar_operando(0, ExpresionAritmetica.valor(1))
+    assert e.actualizar_valor(x, 5) == 6
+    e.reemplazar_operando(1, ExpresionAritmetica.valor(1))
+    assert len(x._padres) == 0